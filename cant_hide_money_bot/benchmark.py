@@ -0,0 +1,292 @@
+"""
+Benchmarks for the slow parts of the bot. Run them like:
+
+    python -m cant_hide_money_bot.benchmark render
+"""
+
+import asyncio
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import click
+import numpy
+import pandas
+from PIL import Image
+
+from . import all_symbols, book, utils
+from .marketdata import MarketData
+from .std import Dir, Mode, Shares, Symbol, Trade
+from .store import Store, db_conn
+
+
+def synthetic_portfolio(num_positions: int, seed: int = 0) -> pandas.DataFrame:
+    """
+    Build a portfolio frame, as book.compute_current_value returns it, with [num_positions] positions
+    """
+    rng = random.Random(seed)
+    symbols = rng.sample(all_symbols.all_symbols(), num_positions)
+    trades = pandas.DataFrame([{
+        book.SYMBOL: symbol,
+        book.DIR: rng.choice(['BUY', 'SELL']),
+        book.QTY: rng.randint(1, 1000),
+        book.TRADE_PRICE: rng.uniform(5, 500),
+        book.TIME: datetime(2020, 1, 1),
+        book.TRADER: 'trader#0000',
+        book.GUILD_ID: 1,
+    } for symbol in symbols])
+    prices = pandas.DataFrame({book.SYMBOL: symbols, book.CURRENT_PRICE: [rng.uniform(5, 500) for _ in symbols]})
+    return book.compute_current_value(book.shares_and_dollars(trades), prices, book.TRADER_INIT_USD)
+
+
+def synthetic_book(num_trades: int, num_guilds: int = 50, traders_per_guild: int = 20, num_symbols: int = 500,
+                   seed: int = 0) -> pandas.DataFrame:
+    """
+    Build a book, as Store.load_book returns it, of [num_trades] trades spread across [num_guilds] guilds with
+    [traders_per_guild] traders each, trading [num_symbols] symbols. The same arguments always give the same book.
+    """
+    rng = numpy.random.default_rng(seed)
+    symbols = numpy.array(all_symbols.all_symbols(), dtype=object)[
+        rng.choice(len(all_symbols.all_symbols()), num_symbols, replace=False)]
+    traders = numpy.array([f'trader-{guild_id}-{i}#0000' for guild_id in range(1, num_guilds + 1)
+                           for i in range(traders_per_guild)], dtype=object)
+    guild_ids = rng.integers(1, num_guilds + 1, num_trades)
+    seconds = numpy.sort(rng.integers(0, 365 * 24 * 60 * 60, num_trades))
+    return pandas.DataFrame({
+        book.SYMBOL: symbols[rng.integers(0, num_symbols, num_trades)],
+        # Mostly buys so that positions build up
+        book.DIR: numpy.where(rng.random(num_trades) < 0.6, Dir.BUY.name, Dir.SELL.name).astype(object),
+        book.QTY: rng.integers(1, 100, num_trades),
+        book.TIME: pandas.Timestamp(2020, 1, 1) + pandas.to_timedelta(seconds, unit='s'),
+        book.TRADE_PRICE: rng.uniform(5, 500, num_trades).round(2),
+        book.TRADER: traders[(guild_ids - 1) * traders_per_guild + rng.integers(0, traders_per_guild, num_trades)],
+        book.GUILD_ID: guild_ids,
+    })
+
+
+def fill_store(store: Store, book_: pandas.DataFrame) -> None:
+    query = '''
+        INSERT INTO trades (symbol, dir, qty, time, price, trader, guild_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+    rows = book_.astype({book.QTY: object, book.GUILD_ID: object, book.TIME: str})[
+        [book.SYMBOL, book.DIR, book.QTY, book.TIME, book.TRADE_PRICE, book.TRADER, book.GUILD_ID]]
+    with db_conn(store.db) as conn:
+        conn.executemany(query, rows.itertuples(index=False, name=None))
+
+
+def time_it(f, iterations: int) -> dict:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        f()
+        timings.append(time.perf_counter() - start)
+    return {
+        'mean_ms': statistics.mean(timings) * 1000,
+        'p50_ms': statistics.median(timings) * 1000,
+        'max_ms': max(timings) * 1000,
+    }
+
+
+def rss_mb() -> float:
+    # Current (not peak) resident set size, in pages, from /proc
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+
+
+def print_timings(name: str, timings: dict) -> None:
+    print(f"{name:<40} mean {timings['mean_ms']:8.2f} ms   p50 {timings['p50_ms']:8.2f} ms   "
+          f"max {timings['max_ms']:8.2f} ms")
+
+
+@click.group()
+def main() -> None:
+    pass
+
+
+@main.command()
+@click.option('--positions', type=int, default=20, help='Number of positions in the rendered portfolio')
+@click.option('--iterations', type=int, default=20)
+def render(positions: int, iterations: int) -> None:
+    """
+    Compare the native table renderer with the imgkit (wkhtmltoimage) one
+    """
+    portfolio = synthetic_portfolio(positions)
+    renderers = [utils.NATIVE]
+    if shutil.which('wkhtmltoimage') is not None:
+        renderers.append(utils.IMGKIT)
+    else:
+        print('wkhtmltoimage is not installed -- skipping the imgkit renderer')
+
+    for renderer in renderers:
+        timings = time_it(lambda: utils.df_to_table(portfolio, title='trader#0000', renderer=renderer), iterations)
+        print_timings(f'df_to_table ({renderer})', timings)
+
+
+def styler_html(df: pandas.DataFrame, title: str = None) -> str:
+    """
+    The HTML that utils.df_to_table used to build with pandas' Styler, kept as the baseline for utils.df_to_html
+    """
+    styler = df.reset_index(drop=True).style
+    styler.hide_index()
+    styler.format(formatter=utils.portfolio_formatters)
+    styler.set_table_styles(utils.table_styles)
+    if title is not None:
+        styler = styler.set_caption(title)
+    styler.applymap(lambda value: f'background-color:{utils.NEGATIVE_BACKGROUND}' if value < 0 else None,
+                    subset=pandas.IndexSlice[:, [book.MARK_PNL, book.RETURN]])
+    return styler.render()
+
+
+BOOK_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def benchmark_book(num_trades: int, iterations: int) -> dict:
+    """
+    Time the book and store operations the bot runs on every command against a book of [num_trades] trades
+    """
+    book_ = synthetic_book(num_trades)
+    # Time everything for the busiest trader, in their guild, the way the bot does
+    trader = book_[book.TRADER].value_counts().index[0]
+    guild_id = book_.loc[book_[book.TRADER] == trader, book.GUILD_ID].iloc[0]
+    guild_book = book.filter_book_for_guild_id(book_, guild_id)
+    symbol = guild_book.loc[guild_book[book.TRADER] == trader, book.SYMBOL].iloc[0]
+    market_data = MarketData(Mode.DEV)
+    loop = asyncio.new_event_loop()
+
+    store = Store(Mode.DEV, in_memory=True)
+    fill_store(store, book_)
+    trade = Trade(symbol=Symbol(symbol), dir_=Dir.BUY, qty=Shares(1), time=datetime.now(), price=100., trader=trader,
+                  guild_id=guild_id)
+    portfolio = loop.run_until_complete(book.all_portfolios(guild_book, market_data))[trader]
+
+    try:
+        return {
+            'load_book': time_it(store.load_book, max(1, iterations // 10)),
+            'persist_trade': time_it(lambda: store.persist_trade(trade), iterations),
+            'usd_for_trader': time_it(lambda: book.usd_for_trader(book_, trader), iterations),
+            'position_for_symbol': time_it(lambda: book.position_for_symbol(book_, trader, symbol), iterations),
+            'all_portfolios': time_it(
+                lambda: loop.run_until_complete(book.all_portfolios(guild_book, market_data)), iterations),
+            'df_to_image': time_it(lambda: utils.df_to_image(portfolio, title=trader), iterations),
+        }
+    finally:
+        loop.close()
+
+
+@main.command(name='book')
+@click.option('--sizes', type=int, multiple=True, default=BOOK_SIZES, help='Numbers of trades in the book (repeatable)')
+@click.option('--iterations', type=int, default=10)
+@click.option('--out', type=click.Path(dir_okay=False), help='Save the results as JSON, for benchmark compare')
+def book_(sizes: list, iterations: int, out: str) -> None:
+    """
+    Time book.py, store.py and df_to_image at several book sizes
+    """
+    results = {}
+    for size in sizes:
+        results[str(size)] = benchmark_book(size, iterations)
+        for name, timings in results[str(size)].items():
+            print_timings(f'{name} ({size} trades)', timings)
+
+    if out is not None:
+        with open(out, 'w') as f:
+            json.dump({'created_at': datetime.now().isoformat(), 'iterations': iterations, 'results': results}, f,
+                      indent=2)
+
+
+@main.command()
+@click.argument('baseline', type=click.Path(exists=True, dir_okay=False))
+@click.argument('current', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', type=float, default=0.2, help='Flag timings that got this much slower (0.2 = 20%)')
+def compare(baseline: str, current: str, threshold: float) -> None:
+    """
+    Compare two sets of results saved by benchmark book --out. Exits with 1 when something got slower.
+    """
+    with open(baseline) as f:
+        baseline_results = json.load(f)['results']
+    with open(current) as f:
+        current_results = json.load(f)['results']
+
+    regressed = False
+    for size, timings in current_results.items():
+        for name, current_timings in timings.items():
+            if (baseline_timings := baseline_results.get(size, {}).get(name)) is None:
+                continue
+            ratio = current_timings['p50_ms'] / baseline_timings['p50_ms']
+            flag = ''
+            if ratio > 1 + threshold:
+                flag = 'SLOWER'
+                regressed = True
+            elif ratio < 1 - threshold:
+                flag = 'faster'
+            print(f"{f'{name} ({size} trades)':<40} {baseline_timings['p50_ms']:10.2f} ms -> "
+                  f"{current_timings['p50_ms']:10.2f} ms  {ratio:6.2f}x  {flag}")
+    sys.exit(1 if regressed else 0)
+
+
+@main.command()
+@click.option('--iterations', type=int, default=20)
+def html(iterations: int) -> None:
+    """
+    Compare building a portfolio table's HTML with pandas' Styler against writing it directly
+    """
+    for rows in [20, 200, 2000]:
+        portfolio = synthetic_portfolio(rows)
+        print_timings(f'styler ({rows} rows)', time_it(lambda: styler_html(portfolio, title='trader#0000'), iterations))
+        print_timings(f'df_to_html ({rows} rows)', time_it(
+            lambda: utils.df_to_html(portfolio, utils.portfolio_formatters,
+                                     negative_columns=(book.MARK_PNL, book.RETURN), title='trader#0000'),
+            iterations))
+
+
+@main.command()
+@click.option('--positions', type=int, default=20, help='Number of positions in the charted portfolio')
+@click.option('--renders', type=int, default=10000)
+@click.option('--window', type=int, default=1000, help='Report latency and RSS every [window] renders')
+def charts(positions: int, renders: int, window: int) -> None:
+    """
+    Check that exposure and return chart latency and memory stay flat over many renders
+    """
+    portfolio = synthetic_portfolio(positions)
+    for start in range(0, renders, window):
+        timings = time_it(lambda: (utils.df_to_exposure_plot(portfolio), utils.df_to_return_plot(portfolio)),
+                          min(window, renders - start))
+        print_timings(f'renders {start:>6}-{start + window:<6}', timings)
+        print(f'{"":<40} rss {rss_mb():8.1f} MiB')
+
+
+@main.command()
+@click.option('--positions', type=int, default=20, help='Number of positions in the rendered portfolio')
+@click.option('--iterations', type=int, default=10)
+@click.option('--max-bytes', type=int, default=None, help='Also encode with this size budget')
+def encode(positions: int, iterations: int, max_bytes: int) -> None:
+    """
+    Compare the size, encoding time and fidelity of each image encoding for a portfolio image
+    """
+    png = utils.df_to_image(synthetic_portfolio(positions), encoding=utils.Encoding(utils.PNG))
+    image = Image.open(io.BytesIO(png))
+    image.load()
+    reference = numpy.asarray(image.convert('RGB'), dtype=int)
+
+    for image_format in [utils.PNG, utils.PALETTE_PNG, utils.WEBP]:
+        encoding = utils.Encoding(image_format, max_bytes=max_bytes)
+        data = utils.encode_image(image, encoding)
+        timings = time_it(lambda: utils.encode_image(image, encoding), iterations)
+        decoded = Image.open(io.BytesIO(data)).convert('RGB')
+        if decoded.size == image.size:
+            error = numpy.abs(numpy.asarray(decoded, dtype=int) - reference)
+            fidelity = f'max pixel error {error.max():3d}, mean {error.mean():.3f}'
+        else:
+            fidelity = f'scaled to {decoded.size[0]}x{decoded.size[1]}'
+        print_timings(f'{image_format:<5} {len(data) / 1024:8.1f} KiB', timings)
+        print(f'{"":<40} {fidelity}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import asyncio
-from typing import Dict, List
+import math
+from typing import Dict, List, Tuple
 
 import numpy
 import pandas
@@ -19,9 +20,12 @@ DOLLARS = 'dollars'
 GUILD_ID = 'guild_id'
 MARK_PNL = 'mark pnl'
 MULT = 'mult'
+NUM_POSITIONS = 'positions'
+NUM_TRADERS = 'traders'
 PORTFOLIO = 'Portfolio'
 POSITION = 'position'
 QTY = 'qty'
+RANK = 'rank'
 RETURN = 'return'
 SHARES = 'shares'
 SYMBOL = 'symbol'
@@ -46,6 +50,22 @@ def filter_book_for_trader(book: pandas.DataFrame, trader: std.Trader) -> pandas
     return book[book[TRADER] == trader]
 
 
+def filter_book_for_symbol(book: pandas.DataFrame, symbol: std.Symbol) -> pandas.DataFrame:
+    return book[book[SYMBOL] == symbol]
+
+
+def trades_page(book: pandas.DataFrame, page: int, trades_per_page: int) -> Tuple[pandas.DataFrame, int]:
+    """
+    Return the trades on [page] (newest first) and the number of pages. Page 1 is the newest [trades_per_page] trades,
+    page 2 the ones before them and so on, so only the last page may be partial. A new trade shifts every page.
+    """
+    num_pages = max(1, math.ceil(len(book.index) / trades_per_page))
+    if not 1 <= page <= num_pages:
+        raise ValueError(f'page {page} does not exist, there are {num_pages} pages')
+    newest_first = book.iloc[::-1]
+    return newest_first.iloc[(page - 1) * trades_per_page:page * trades_per_page], num_pages
+
+
 def shares_and_dollars(book: pandas.DataFrame) -> pandas.DataFrame:
     book[MULT] = book[DIR].apply(lambda dir_: 1 if dir_ == BUY else -1)
     book[SHARES] = book[QTY] * book[MULT]
@@ -158,3 +178,40 @@ async def all_portfolios(book: pandas.DataFrame, market_data: marketdata.MarketD
             portfolios[trader] = compute_current_value(trader_book, current_prices, TRADER_INIT_USD)
 
     return portfolios
+
+
+async def leaderboard(book: pandas.DataFrame,
+                      market_data: marketdata.MarketData) -> Tuple[pandas.DataFrame, pandas.DataFrame]:
+    """
+    Compute a one-row fund summary and a leaderboard with one row per trader, ranked by portfolio value, from a
+    single pass over the book
+    """
+    book = shares_and_dollars(book)
+    positions = book.groupby([TRADER, SYMBOL], as_index=False).agg({SHARES: 'sum', DOLLARS: 'sum'})
+    held_symbols = list(positions.loc[positions[SHARES] != 0, SYMBOL].unique())
+    symbols_data = await market_data.get_symbols_data(held_symbols, use_cache=True)
+    prices = {symbol: symbol_data.mid() for symbol, symbol_data in symbols_data.items()}
+    # Positions we could not get a price for are worth 0, as in compute_current_value
+    positions[CURRENT_PRICE] = positions[SYMBOL].map(prices).fillna(0).astype(float)
+    positions[VALUE] = positions[SHARES] * positions[CURRENT_PRICE]
+    positions[NUM_POSITIONS] = positions[SHARES] != 0
+
+    traders = positions.groupby(TRADER, as_index=False).agg(
+        **{USD: (DOLLARS, 'sum'), VALUE: (VALUE, 'sum'), NUM_POSITIONS: (NUM_POSITIONS, 'sum')})
+    traders[USD] += TRADER_INIT_USD
+    traders[VALUE] += traders[USD]
+    traders[MARK_PNL] = traders[VALUE] - TRADER_INIT_USD
+    traders[RETURN] = traders[MARK_PNL] / TRADER_INIT_USD * 100.
+    traders = traders.sort_values(VALUE, ascending=False, kind='mergesort')
+    traders.insert(0, RANK, numpy.arange(1, len(traders.index) + 1))
+    traders = traders[[RANK, TRADER, VALUE, USD, NUM_POSITIONS, MARK_PNL, RETURN]]
+
+    fund_shares = positions.groupby(SYMBOL)[SHARES].sum()
+    summary = pandas.DataFrame([{
+        NUM_TRADERS: len(traders.index),
+        NUM_POSITIONS: int((fund_shares != 0).sum()),
+        USD: traders[USD].sum() - len(traders.index) * TRADER_INIT_USD + FUND_INIT_USD,
+        VALUE: traders[MARK_PNL].sum() + FUND_INIT_USD,
+    }])
+
+    return summary, traders
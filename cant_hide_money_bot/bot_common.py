@@ -8,6 +8,11 @@ from pyrsistent import pmap
 
 from .std import Guild_id, Settings
 
+# Set the "portfolios" setting to "compact" to get one leaderboard instead of one image per trader from !$$ and the
+# reporter
+PORTFOLIOS_SETTING = 'portfolios'
+COMPACT_PORTFOLIOS = 'compact'
+
 
 def get_setting(settings: Settings, guild_id: Guild_id, key: str, f=None, default=None) -> Optional[str]:
     value = settings.get(guild_id, pmap()).get(key)
@@ -1,6 +1,7 @@
 """An API for querying data as JSON
 """
 
+import dotenv
 import pandas
 import flask
 import flask_cors
@@ -8,14 +9,15 @@ import flask_cors
 from . import book, std, marketdata
 from .store import Store
 
+dotenv.load_dotenv()
+
 app = flask.Flask(__name__)
 flask_cors.CORS(app)
 
 
-RAPID_API_KEY = None
 MODE = std.Mode.PROD
 
-MARKET_DATA = marketdata.MarketData(RAPID_API_KEY, MODE)
+MARKET_DATA = marketdata.MarketData(MODE, cache=marketdata.create_cache(MODE))
 STORE = Store(MODE)
 
 
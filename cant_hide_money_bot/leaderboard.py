@@ -0,0 +1,39 @@
+"""
+This module renders leaderboards and uploads them to Discord, for both the bot and the reporter
+"""
+
+import asyncio
+import io
+
+import discord
+import pandas
+
+from . import book, metrics
+from .marketdata import MarketData
+from .metrics import METRICS
+from .render import RenderPool
+
+LEADERBOARD_TRADERS_PER_PAGE = 25
+
+# Discord allows at most this many attachments per message
+MAX_FILES_PER_MESSAGE = 10
+
+
+async def send_leaderboard(destination, book_: pandas.DataFrame, market_data: MarketData,
+                           render_pool: RenderPool) -> None:
+    """
+    Send the fund summary and a leaderboard of every trader in [book_] to [destination] (a channel or a context), as
+    few messages as possible with one image per page of traders
+    """
+    summary, leaderboard = await book.leaderboard(book_, market_data)
+    pages = [leaderboard.iloc[i:i + LEADERBOARD_TRADERS_PER_PAGE]
+             for i in range(0, len(leaderboard.index), LEADERBOARD_TRADERS_PER_PAGE)]
+    with METRICS.stage(metrics.RENDER):
+        pngs = await asyncio.gather(*(
+            render_pool.render_leaderboard(page, summary, title=f'Leaderboard {i + 1}/{len(pages)}')
+            for i, page in enumerate(pages)))
+    files = [discord.File(io.BytesIO(png), filename=f'leaderboard-{i + 1}.{render_pool.encoding.extension}')
+             for i, png in enumerate(pngs)]
+    with METRICS.stage(metrics.UPLOAD):
+        for i in range(0, len(files), MAX_FILES_PER_MESSAGE):
+            await destination.send(files=files[i:i + MAX_FILES_PER_MESSAGE])
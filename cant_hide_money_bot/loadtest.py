@@ -0,0 +1,187 @@
+"""
+A load test for the bot that runs without Discord. The bot's commands are called directly with fake contexts, an
+in-memory store and replayed quotes, from many traders in many guilds at once:
+
+    python -m cant_hide_money_bot.loadtest --guilds 20 --commands 2000
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import click
+import numpy
+import tabulate
+
+from . import all_symbols, server
+from .marketdata import MarketData, ReplayProvider
+from .render import RenderPool
+from .std import Mode
+from .store import Store
+
+
+@dataclass
+class FakeGuild:
+    id: int
+    name: str
+
+
+@dataclass
+class FakeAuthor:
+    id: int
+    name: str
+    discriminator: str = '0000'
+
+    def __str__(self) -> str:
+        return f'{self.name}#{self.discriminator}'
+
+
+@dataclass
+class FakeChannel:
+    name: str = 'general'
+
+
+@dataclass
+class FakeMessage:
+    content: str = ''
+    mentions: list = field(default_factory=list)
+
+
+@dataclass
+class FakeCommand:
+    name: str
+
+
+@dataclass
+class FakeContext:
+    """
+    Stands in for discord.ext.commands.Context: whatever the bot sends is kept in [sent] instead of going to Discord
+    """
+    guild: FakeGuild
+    author: FakeAuthor
+    command: FakeCommand
+    message: FakeMessage = field(default_factory=FakeMessage)
+    channel: FakeChannel = field(default_factory=FakeChannel)
+    sent: list = field(default_factory=list)
+
+    async def send(self, content=None, file=None, files=None) -> None:
+        self.sent.append(content if file is None and files is None else (content, file or files))
+
+
+def install(store: Store, market_data: MarketData, render_pool: RenderPool) -> None:
+    """
+    Set up the server's APP the way server.run_bot does, in prod mode so that every guild is served
+    """
+    server.APP = server.App(Mode.PROD, 0, store, market_data, render_pool)
+    market_data.add_listener(server.on_quotes)
+
+
+# Commands to send and how often to send them, relative to each other
+COMMAND_WEIGHTS = {
+    'BUY': 30,
+    'SELL': 20,
+    'CLOSE': 10,
+    '$': 20,
+    '$$': 10,
+    'T': 10,
+}
+
+
+async def send_command(name: str, guild: FakeGuild, author: FakeAuthor, symbol: str, rng: random.Random) -> None:
+    ctx = FakeContext(guild=guild, author=author, command=FakeCommand(name))
+    if name == 'BUY':
+        await server.buy.callback(ctx, symbol, f'${rng.randint(100, 5000)}')
+    elif name == 'SELL':
+        await server.sell.callback(ctx, symbol, str(rng.randint(1, 20)))
+    elif name == 'CLOSE':
+        await server.close.callback(ctx, symbol)
+    elif name == '$':
+        await server.trader_portfolio.callback(ctx)
+    elif name == '$$':
+        await server.all_portfolios_.callback(ctx)
+    elif name == 'T':
+        await server.trades.callback(ctx)
+    else:
+        raise ValueError(f'unknown command: {name}')
+
+
+async def run(num_guilds: int = 10, traders_per_guild: int = 5, num_commands: int = 1000, concurrency: int = 50,
+              symbols_per_trader: int = 10, seed: int = 0) -> Dict[str, List[float]]:
+    """
+    Send [num_commands] random commands, at most [concurrency] at a time, from [traders_per_guild] traders in each of
+    [num_guilds] guilds. Returns the latency of every command, in seconds, by command name.
+    """
+    rng = random.Random(seed)
+    provider = server.APP.market_data.provider
+    symbols = list(provider.paths) if isinstance(provider, ReplayProvider) else list(all_symbols.all_symbols())
+    traders = [(FakeGuild(id=guild_id, name=f'guild-{guild_id}'),
+                FakeAuthor(id=guild_id * 1000 + i, name=f'trader-{guild_id}-{i}'),
+                rng.sample(symbols, symbols_per_trader))
+               for guild_id in range(1, num_guilds + 1) for i in range(traders_per_guild)]
+    names, weights = zip(*COMMAND_WEIGHTS.items())
+    commands = [(rng.choice(traders), rng.choices(names, weights)[0]) for _ in range(num_commands)]
+
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(trader, name: str) -> None:
+        guild, author, trader_symbols = trader
+        async with semaphore:
+            start = time.perf_counter()
+            await send_command(name, guild, author, rng.choice(trader_symbols), rng)
+            latencies[name].append(time.perf_counter() - start)
+
+    await asyncio.gather(*(timed(trader, name) for trader, name in commands))
+    # Post-trade portfolios go out after the trades themselves
+    await server.APP.portfolio_debouncer.drain()
+    return latencies
+
+
+def report(latencies: Dict[str, List[float]], seconds: float) -> str:
+    def row(name: str, samples: List[float]) -> list:
+        if not samples:
+            return [name, 0, '', '']
+        p50, p99 = numpy.percentile(samples, [50, 99]) * 1000
+        return [name, len(samples), f'{p50:.1f}', f'{p99:.1f}']
+
+    everything = [sample for samples in latencies.values() for sample in samples]
+    rows = [row(name, samples) for name, samples in latencies.items()] + [row('all', everything)]
+    table = tabulate.tabulate(rows, headers=['command', 'count', 'p50 ms', 'p99 ms'], disable_numparse=True)
+    return f'{table}\n\n{len(everything)} commands in {seconds:.1f} s ({len(everything) / seconds:.1f} commands/s)'
+
+
+@click.command()
+@click.option('--guilds', type=int, default=10)
+@click.option('--traders', type=int, default=5, help='Traders per guild')
+@click.option('--commands', 'num_commands', type=int, default=1000)
+@click.option('--concurrency', type=int, default=50, help='Commands in flight at once')
+@click.option('--symbols', type=int, default=200, help='Number of symbols to replay quotes for')
+@click.option('--quote-latency', type=float, default=0.05, help='Seconds each quote request takes')
+@click.option('--render-workers', type=int, default=None)
+@click.option('--seed', type=int, default=0)
+def main(guilds: int, traders: int, num_commands: int, concurrency: int, symbols: int, quote_latency: float,
+         render_workers: Optional[int], seed: int) -> None:
+    # The bot logs every trade and cache hit
+    logging.getLogger().setLevel(logging.WARNING)
+
+    provider = ReplayProvider.synthetic(random.Random(seed).sample(all_symbols.all_symbols(), symbols), seed=seed,
+                                        latency_seconds=quote_latency)
+    render_pool = RenderPool(max_workers=render_workers)
+
+    async def run_and_time() -> None:
+        install(Store(Mode.DEV, in_memory=True), MarketData(Mode.DEV, provider=provider), render_pool)
+        start = time.perf_counter()
+        latencies = await run(guilds, traders, num_commands, concurrency, seed=seed)
+        print(report(latencies, time.perf_counter() - start))
+
+    try:
+        asyncio.run(run_and_time())
+    finally:
+        render_pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
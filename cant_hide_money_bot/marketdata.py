@@ -2,13 +2,26 @@
 This module contains functions for getting stock prices
 """
 
+import abc
+import asyncio
+import json
 import logging
+import math
+import os
+import random
+import time
 import typing
 
+import click
 import httpx
 import requests
 
-from . import std
+from . import all_symbols, metrics, std
+from .quote_cache import QuoteCache, quote_cache_path
+
+CACHE_MAX_AGE_SECONDS = 300
+
+YAHOO_QUOTE_URL = 'https://query1.finance.yahoo.com/v7/finance/quote'
 
 # $1 always trades for $1
 USD_SYMBOL_DATA = std.SymbolData(bid=1, ask=1, volume=9999999999999, currency='USD')
@@ -33,36 +46,277 @@ def validate_symbol_data(symbol_data: std.SymbolData, api_data: typing.Dict) ->
     return symbol_data
 
 
-async def yahoo(symbols: typing.List[std.Symbol]) -> std.SymbolData:
-    url = f'https://query1.finance.yahoo.com/v7/finance/quote'
-    query_string = {
-        'corsDomain': 'finance.yahoo.com',
-        'symbols': ','.join(symbols),
-        'region': 'US'
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=query_string)
-    if response.status_code != requests.codes.ok or response.text == '':
+def parse_quote(api_data: typing.Dict) -> typing.Tuple[std.Symbol, std.SymbolData]:
+    bid = ask = api_data.get('regularMarketPrice')
+    volume = api_data.get('regularMarketVolume')
+    currency = api_data.get('currency')
+    symbol = std.Symbol(api_data.get('symbol'))
+
+    symbol_data = validate_symbol_data(std.SymbolData(
+        bid=bid,
+        ask=ask,
+        volume=volume,
+        currency=currency), api_data)
+
+    return symbol, symbol_data
+
+
+class CircuitOpenError(std.TradeError):
+    pass
+
+
+class TokenBucket:
+    """
+    A rate limiter that allows [rate] acquisitions per second on average and bursts of up to [capacity]
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        # Take a token now, going into debt if there are none, and then wait until the debt is paid off. There is no
+        # await between reading and updating the bucket so this needs no lock.
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate) - 1
+        self._updated_at = now
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Fails fast once [failure_threshold] requests in a row have failed. After [reset_seconds] one request is let through
+    again and the breaker closes if it succeeds.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: typing.Optional[float] = None
+
+    def is_open(self) -> bool:
+        if self._opened_at is None:
+            return False
+        return (time.monotonic() - self._opened_at) < self.reset_seconds
+
+    def check(self) -> None:
+        if self.is_open():
+            raise CircuitOpenError('The market data API is currently unavailable -- try again in a minute.')
+
+    def acquire(self) -> None:
+        """
+        Call before every request. Raises CircuitOpenError while the breaker is open. Once [reset_seconds] have passed,
+        the first caller is let through as the trial request and the breaker stays open for everyone else until the
+        trial succeeds (or for another [reset_seconds] if it never reports back).
+        """
+        self.check()
+        if self._opened_at is not None:
+            logging.info('market data circuit breaker half-open: letting one request through')
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            if not self.is_open():
+                logging.warning(f'market data circuit breaker opened after {self._failures} failures')
+            self._opened_at = time.monotonic()
+
+
+# Status codes worth retrying -- anything else means the request itself was bad
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class YahooFetcher:
+    """
+    Fetches quotes from Yahoo in chunks of at most [chunk_size] symbols. Chunks are fetched concurrently, at most
+    [max_concurrency] at a time and at most [rate] requests per second. Transient failures are retried with jittered
+    exponential backoff.
+    """
+
+    def __init__(self, url: str = YAHOO_QUOTE_URL, chunk_size: int = 50, max_concurrency: int = 4, rate: float = 5,
+                 max_retries: int = 3, backoff_seconds: float = 0.5, max_backoff_seconds: float = 8,
+                 timeout_seconds: float = 10, breaker: typing.Optional[CircuitBreaker] = None) -> None:
+        self.url = url
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout_seconds = timeout_seconds
+        self.rate_limiter = TokenBucket(rate=rate, capacity=max_concurrency)
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.max_concurrency = max_concurrency
+
+    def chunks(self, symbols: typing.List[std.Symbol]) -> typing.List[typing.List[std.Symbol]]:
+        return [symbols[i:i + self.chunk_size] for i in range(0, len(symbols), self.chunk_size)]
+
+    def backoff(self, attempt: int) -> float:
+        # "Full jitter": sleep anywhere between 0 and the exponential backoff so retries from many chunks spread out
+        return random.uniform(0, min(self.max_backoff_seconds, self.backoff_seconds * 2 ** attempt))
+
+    async def fetch(self, symbols: typing.List[std.Symbol]) -> typing.Dict[std.Symbol, std.SymbolData]:
+        if not symbols:
+            return {}
+        self.breaker.check()
+        # The semaphore is created per call because asyncio primitives are bound to the loop they are first used on
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+            chunks_data = await asyncio.gather(
+                *(self._fetch_chunk(client, semaphore, chunk) for chunk in self.chunks(symbols)))
+        return {symbol: symbol_data for chunk_data in chunks_data for symbol, symbol_data in chunk_data.items()}
+
+    async def _fetch_chunk(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                           symbols: typing.List[std.Symbol]) -> typing.Dict[std.Symbol, std.SymbolData]:
+        query_string = {
+            'corsDomain': 'finance.yahoo.com',
+            'symbols': ','.join(symbols),
+            'region': 'US'
+        }
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                self.breaker.acquire()
+                await self.rate_limiter.acquire()
+                try:
+                    response = await client.get(self.url, params=query_string)
+                except httpx.TransportError as e:
+                    logging.warning(f'market data request failed (attempt {attempt + 1}): {e!r}')
+                else:
+                    if response.status_code == requests.codes.ok and response.text != '':
+                        self.breaker.record_success()
+                        api_data = response.json().get('quoteResponse', {}).get('result', [])
+                        return dict(parse_quote(d) for d in api_data)
+                    if response.status_code not in TRANSIENT_STATUS_CODES:
+                        raise error(symbols)
+                    logging.warning(f'market data request returned {response.status_code} (attempt {attempt + 1})')
+                self.breaker.record_failure()
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.backoff(attempt))
         raise error(symbols)
-    api_data = response.json().get('quoteResponse', {}).get('result', [])
 
-    def parse(api_data) -> typing.Tuple[std.Symbol, std.SymbolData]:
-        bid = ask = api_data.get('regularMarketPrice')
-        volume = api_data.get('regularMarketVolume')
-        currency = api_data.get('currency')
-        symbol = std.Symbol(api_data.get('symbol'))
 
-        symbol_data = validate_symbol_data(std.SymbolData(
-            bid=bid,
-            ask=ask,
-            volume=volume,
-            currency=currency), api_data)
+async def yahoo(symbols: typing.List[std.Symbol],
+                fetcher: typing.Optional[YahooFetcher] = None) -> typing.Dict[std.Symbol, std.SymbolData]:
+    fetcher = fetcher if fetcher is not None else YahooFetcher()
+    return await fetcher.fetch(symbols)
+
+
+class QuoteProvider(abc.ABC):
+    """
+    A source of quotes. Providers return data only for the symbols they know about and raise std.TradeError when they
+    cannot fetch quotes at all.
+    """
+
+    # Whether MarketData may answer requests for this provider's quotes from its cache
+    cacheable = True
+
+    @abc.abstractmethod
+    async def get_quotes(self, symbols: typing.List[std.Symbol]) -> typing.Dict[std.Symbol, std.SymbolData]:
+        pass
 
-        return symbol, symbol_data
 
-    symbols_and_data = [parse(d) for d in api_data]
+class YahooProvider(QuoteProvider):
+    def __init__(self, fetcher: typing.Optional[YahooFetcher] = None) -> None:
+        # Keep one fetcher so that rate limiting and the circuit breaker apply across calls
+        self.fetcher = fetcher if fetcher is not None else YahooFetcher()
 
-    return {symbol: symbol_data for symbol, symbol_data in symbols_and_data}
+    async def get_quotes(self, symbols: typing.List[std.Symbol]) -> typing.Dict[std.Symbol, std.SymbolData]:
+        return await yahoo(symbols, self.fetcher)
+
+
+class ConstantProvider(QuoteProvider):
+    """
+    Quotes every symbol at the same price. This is what DEV mode uses so that we don't hit the market data API.
+    """
+
+    # Tests change the price between calls and expect to see the new price right away
+    cacheable = False
+
+    def __init__(self, symbol_data: std.SymbolData = DEV_SYMBOL_DATA) -> None:
+        self.symbol_data = symbol_data
+
+    async def get_quotes(self, symbols: typing.List[std.Symbol]) -> typing.Dict[std.Symbol, std.SymbolData]:
+        return {symbol: self.symbol_data for symbol in symbols}
+
+
+class ReplayProvider(QuoteProvider):
+    """
+    Serves recorded or synthetic price paths so that the bot can be driven at scale without a network. Every request
+    for a symbol moves one step along its path, wrapping around at the end. Each request waits [latency_seconds]
+    (+/- [latency_jitter_seconds]) and fails with probability [error_rate], like the real API occasionally does.
+
+    Replay files are JSON objects mapping symbols to lists of prices.
+    """
+
+    def __init__(self, paths: typing.Dict[str, typing.List[float]], latency_seconds: float = 0.,
+                 latency_jitter_seconds: float = 0., error_rate: float = 0., volume: int = 10000000,
+                 seed: typing.Optional[int] = None) -> None:
+        self.paths = {std.Symbol(symbol): prices for symbol, prices in paths.items() if prices}
+        self.latency_seconds = latency_seconds
+        self.latency_jitter_seconds = latency_jitter_seconds
+        self.error_rate = error_rate
+        self.volume = volume
+        self._steps: typing.Dict[std.Symbol, int] = {}
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'ReplayProvider':
+        with open(path) as f:
+            return cls(json.load(f), **kwargs)
+
+    @classmethod
+    def synthetic(cls, symbols: typing.List[str], steps: int = 1000, volatility: float = 0.01, seed: int = 0,
+                  **kwargs) -> 'ReplayProvider':
+        """
+        Generate a geometric random walk for each symbol, starting somewhere between $5 and $500
+        """
+        rng = random.Random(seed)
+        paths = {}
+        for symbol in symbols:
+            price = rng.uniform(5, 500)
+            path = []
+            for _ in range(steps):
+                price *= math.exp(rng.gauss(0, volatility))
+                path.append(round(price, 2))
+            paths[symbol] = path
+        return cls(paths, seed=seed, **kwargs)
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.paths, f)
+
+    async def get_quotes(self, symbols: typing.List[std.Symbol]) -> typing.Dict[std.Symbol, std.SymbolData]:
+        latency = self.latency_seconds + self._random.uniform(-1, 1) * self.latency_jitter_seconds
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if self._random.random() < self.error_rate:
+            raise error(symbols)
+
+        results = {}
+        for symbol in symbols:
+            if (path := self.paths.get(symbol)) is None:
+                continue
+            step = self._steps.get(symbol, 0)
+            self._steps[symbol] = step + 1
+            price = path[step % len(path)]
+            results[symbol] = std.SymbolData(bid=price, ask=price, volume=self.volume, currency='USD')
+        return results
+
+
+def create_cache(mode: std.Mode, shared: bool = False):
+    """
+    Use the quote cache shared by every process on this machine when [shared] or SHARED_QUOTE_CACHE is set, otherwise
+    keep quotes in this process
+    """
+    if shared or os.getenv('SHARED_QUOTE_CACHE', '').lower() == 'true':
+        return QuoteCache(quote_cache_path(mode), max_age_seconds=CACHE_MAX_AGE_SECONDS)
+    return std.TimedCache(max_age_seconds=CACHE_MAX_AGE_SECONDS)
 
 
 class MarketData:
@@ -70,12 +324,35 @@ class MarketData:
     This class caches market data for 5 minutes to reduce API calls
     """
 
-    def __init__(self, mode: std.Mode, symbol_data_for_test=None) -> None:
+    def __init__(self, mode: std.Mode, symbol_data_for_test=None, cache=None,
+                 provider: typing.Optional[QuoteProvider] = None) -> None:
         self.mode = mode
-        self.cache = std.TimedCache(max_age_seconds=300)
-        self.symbol_data_for_test = symbol_data_for_test
+        self.cache = cache if cache is not None else std.TimedCache(max_age_seconds=CACHE_MAX_AGE_SECONDS)
+        if provider is not None:
+            self.provider = provider
+        elif mode is std.Mode.DEV:
+            self.provider = ConstantProvider(symbol_data_for_test or DEV_SYMBOL_DATA)
+        else:
+            self.provider = YahooProvider()
+        # Called with every batch of freshly fetched quotes
+        self.listeners: typing.List[typing.Callable[[typing.Dict[std.Symbol, std.SymbolData]], None]] = []
+
+    def add_listener(self, listener: typing.Callable[[typing.Dict[std.Symbol, std.SymbolData]], None]) -> None:
+        self.listeners.append(listener)
+
+    @property
+    def symbol_data_for_test(self) -> typing.Optional[std.SymbolData]:
+        return self.provider.symbol_data if isinstance(self.provider, ConstantProvider) else None
+
+    @symbol_data_for_test.setter
+    def symbol_data_for_test(self, symbol_data: typing.Optional[std.SymbolData]) -> None:
+        self.provider = ConstantProvider(symbol_data or DEV_SYMBOL_DATA)
 
     async def get_symbols_data(self, symbols: typing.List[std.Symbol], use_cache: bool) -> std.SymbolData:
+        with metrics.METRICS.stage(metrics.QUOTE_FETCH):
+            return await self._get_symbols_data(symbols, use_cache)
+
+    async def _get_symbols_data(self, symbols: typing.List[std.Symbol], use_cache: bool) -> std.SymbolData:
         symbols_to_fetch = symbols
         results = {}
 
@@ -83,25 +360,40 @@ class MarketData:
             results[std.USD] = USD_SYMBOL_DATA
             symbols_to_fetch = [symbol for symbol in symbols_to_fetch if symbol != std.USD]
 
-        if self.mode is std.Mode.DEV:
-            if self.symbol_data_for_test is not None:
-                results.update({symbol: self.symbol_data_for_test for symbol in symbols_to_fetch})
-            else:
-                symbol_data = DEV_SYMBOL_DATA
-        else:
-            for symbol in symbols_to_fetch:
-                if ((symbol_data := self.cache.get(symbol)) is not None) and use_cache:
-                    logging.info(f'found {symbol} {symbol_data} in cache')
-                    results[symbol] = symbol_data
-
-            # Filter out the symbols we found in the cache
-            symbols = [symbol for symbol in symbols_to_fetch if symbol not in results]
+        use_cache = use_cache and self.provider.cacheable
+        if use_cache:
+            cached = self.cache.get_many(symbols_to_fetch)
+            for symbol, symbol_data in cached.items():
+                logging.info(f'found {symbol} {symbol_data} in cache')
+            results.update(cached)
 
-            symbols_and_data = await yahoo(symbols_to_fetch)
+        # Filter out the symbols we found in the cache
+        symbols_to_fetch = [symbol for symbol in symbols_to_fetch if symbol not in results]
 
+        if symbols_to_fetch:
+            symbols_and_data = await self.provider.get_quotes(symbols_to_fetch)
+            if self.provider.cacheable:
+                # Only fresh quotes go in the cache so that cached entries still expire
+                self.cache.put_many(symbols_and_data)
             results.update(symbols_and_data)
-
-        for symbol, symbol_data in results.items():
-            self.cache.put(symbol, symbol_data)
+            for listener in self.listeners:
+                listener(symbols_and_data)
 
         return results
+
+
+@click.command()
+@click.option('--out', type=click.Path(dir_okay=False), required=True, help='Where to write the replay file')
+@click.option('--num-symbols', type=int, default=500, help='How many symbols to generate price paths for')
+@click.option('--steps', type=int, default=1000, help='How many prices to generate per symbol')
+@click.option('--seed', type=int, default=0)
+def main(out: str, num_symbols: int, steps: int, seed: int) -> None:
+    """
+    Generate a synthetic replay file for ReplayProvider
+    """
+    symbols = random.Random(seed).sample(all_symbols.all_symbols(), num_symbols)
+    ReplayProvider.synthetic(symbols, steps=steps, seed=seed).save(out)
+
+
+if __name__ == '__main__':
+    main()
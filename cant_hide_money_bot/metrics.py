@@ -0,0 +1,135 @@
+"""
+This module records latency histograms for bot commands and for the stages of the hot paths (quote fetch, lock wait,
+ledger update, persist, render, upload) and serves them over HTTP in the Prometheus text format
+"""
+
+import logging
+import math
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+import tabulate
+from aiohttp import web
+
+# Kinds of timings
+COMMAND = 'command'
+STAGE = 'stage'
+
+# Stages
+QUOTE_FETCH = 'quote_fetch'
+LOCK_WAIT = 'lock_wait'
+LEDGER_UPDATE = 'ledger_update'
+PERSIST = 'persist'
+RENDER = 'render'
+UPLOAD = 'upload'
+# How long after startup the first command was answered quickly (observed once per process)
+FIRST_FAST_RESPONSE = 'first_fast_response'
+
+# Upper bounds of the histogram buckets
+BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1., 2.5, 5., 10., math.inf)
+
+
+class Histogram:
+    """
+    Counts observations in fixed buckets so that recording one is cheap and memory never grows
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS_SECONDS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.
+        self.max = 0.
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        An upper bound for the [q] quantile: the upper bound of the bucket it falls in (or the largest observation)
+        """
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket, self.max)
+        return self.max
+
+
+class Metrics:
+    """
+    A histogram for every (kind, name) timing that has been observed
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+
+    def observe(self, kind: str, name: str, seconds: float) -> None:
+        if (histogram := self.histograms.get((kind, name))) is None:
+            histogram = self.histograms[(kind, name)] = Histogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, kind: str, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(kind, name, time.perf_counter() - start)
+
+    def stage(self, name: str):
+        return self.timer(STAGE, name)
+
+    def summary(self, kind: str) -> str:
+        """
+        A text table of the count and latency percentiles of every [kind] timing
+        """
+        rows = [[name, histogram.count, *(f'{1000 * s:.1f}' for s in (
+            histogram.quantile(.5), histogram.quantile(.99), histogram.max))]
+            for (kind_, name), histogram in sorted(self.histograms.items()) if kind_ == kind]
+        return tabulate.tabulate(rows, headers=[kind, 'count', 'p50 ms', 'p99 ms', 'max ms'], disable_numparse=True)
+
+    def prometheus(self) -> str:
+        lines = []
+        for kind in (COMMAND, STAGE):
+            metric = f'cant_hide_money_bot_{kind}_seconds'
+            lines.append(f'# TYPE {metric} histogram')
+            for (kind_, name), histogram in sorted(self.histograms.items()):
+                if kind_ != kind:
+                    continue
+                cumulative = 0
+                for bucket, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    le = '+Inf' if bucket == math.inf else repr(bucket)
+                    lines.append(f'{metric}_bucket{{{kind}="{name}",le="{le}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{{kind}="{name}"}} {histogram.sum}')
+                lines.append(f'{metric}_count{{{kind}="{name}"}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+# The bot's metrics
+METRICS = Metrics()
+
+
+async def serve(metrics: Metrics, port: int, host: str = '127.0.0.1') -> web.AppRunner:
+    """
+    Serve [metrics] at http://[host]:[port]/metrics. Only listens on localhost by default.
+    """
+    async def handle_metrics(_request: web.Request) -> web.Response:
+        return web.Response(text=metrics.prometheus())
+
+    app = web.Application()
+    app.router.add_get('/metrics', handle_metrics)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logging.info(f'serving metrics on http://{host}:{port}/metrics')
+    return runner
@@ -0,0 +1,102 @@
+"""
+This module keeps resting limit and stop orders indexed by symbol and price so that a new quote only has to look at
+the orders it triggers
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum, unique
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .std import Dir, Dollars, Guild_id, Shares, Symbol, SymbolData, Trader
+
+
+@unique
+class OrderType(Enum):
+    # Trade at [price] or better: buy once the ask is at or below it, sell once the bid is at or above it
+    LIMIT = 1
+    # Trade once the price moves through [price]: buy once the ask is at or above it, sell once the bid is at or below
+    # it
+    STOP = 2
+
+
+@dataclass(frozen=True)
+class Order:
+    id: int
+    type_: OrderType
+    symbol: Symbol
+    dir_: Dir
+    qty: Union[Shares, Dollars]
+    price: float  # The price that triggers the order
+    trader: Trader
+    guild_id: Guild_id
+    time: datetime  # The time the order was placed
+
+    def triggers_below(self) -> bool:
+        """
+        Whether the order triggers when the price falls to [price] (as opposed to when it rises to it)
+        """
+        return (self.type_ is OrderType.LIMIT) == (self.dir_ is Dir.BUY)
+
+
+def trigger_price(dir_: Dir, symbol_data: SymbolData) -> float:
+    # Orders trigger on the price they would trade at
+    return symbol_data.ask if dir_ is Dir.BUY else symbol_data.bid
+
+
+class OrderBook:
+    """
+    Resting orders, kept per (symbol, direction, trigger side) in a list sorted by key. The key is the order price for
+    orders that trigger when the price falls and the negated order price for orders that trigger when it rises, so
+    that the orders a quote triggers are always the tail of a list: finding and removing them is a bisect and a slice.
+    """
+
+    def __init__(self, orders: Iterable[Order] = ()) -> None:
+        self.orders: Dict[int, Order] = {}
+        self._levels: Dict[Tuple[Symbol, Dir, bool], List[Tuple[float, int]]] = {}
+        for order in orders:
+            self.add(order)
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    @staticmethod
+    def _key(order: Order) -> Tuple[float, int]:
+        return (order.price if order.triggers_below() else -order.price), order.id
+
+    def add(self, order: Order) -> None:
+        self.orders[order.id] = order
+        insort(self._levels.setdefault((order.symbol, order.dir_, order.triggers_below()), []), self._key(order))
+
+    def remove(self, order_id: int) -> Optional[Order]:
+        if (order := self.orders.pop(order_id, None)) is None:
+            return None
+        levels = self._levels[(order.symbol, order.dir_, order.triggers_below())]
+        key = self._key(order)
+        del levels[bisect_left(levels, key)]
+        return order
+
+    def symbols(self) -> List[Symbol]:
+        return sorted({symbol for (symbol, _dir, _below), levels in self._levels.items() if levels})
+
+    def for_trader(self, trader: Trader, guild_id: Guild_id) -> List[Order]:
+        return [order for order in self.orders.values() if order.trader == trader and order.guild_id == guild_id]
+
+    def pop_triggered(self, symbol: Symbol, symbol_data: SymbolData) -> List[Order]:
+        """
+        Remove and return the orders for [symbol] that [symbol_data] triggers, oldest first
+        """
+        triggered = []
+        for dir_ in Dir:
+            price = trigger_price(dir_, symbol_data)
+            for below in (True, False):
+                if not (levels := self._levels.get((symbol, dir_, below))):
+                    continue
+                # Orders that trigger when the price falls to their price have a price at or above it, and orders that
+                # trigger when it rises to their price have a price at or below it. Either way their key is at least
+                # this threshold.
+                start = bisect_left(levels, ((price if below else -price),))
+                triggered.extend(self.orders.pop(order_id) for _key, order_id in levels[start:])
+                del levels[start:]
+        return sorted(triggered, key=lambda order: order.id)
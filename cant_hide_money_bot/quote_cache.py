@@ -0,0 +1,107 @@
+"""
+This module provides a quote cache backed by SQLite so that the bot, the reporter and every json_api worker can share
+the quotes that any one of them fetched
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .std import Mode, Symbol, SymbolData
+from .store import DEFAULT_DIR
+
+DEFAULT_MAX_AGE_SECONDS = 300
+
+
+def quote_cache_path(mode: Mode) -> Path:
+    return DEFAULT_DIR / f'quotes.{mode.name.lower()}.db'
+
+
+class QuoteCache:
+    """
+    A cache with the same interface as std.TimedCache where every entry is stored with the time it was fetched and
+    how long it stays valid. Readers in other processes see an entry as soon as the writer's transaction commits.
+    """
+
+    def __init__(self, path: Path, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self._max_age_seconds = max_age_seconds
+        logging.info(f'using quote cache: {self.path}')
+
+        create_quotes_table = '''
+            CREATE TABLE IF NOT EXISTS quotes (
+                symbol TEXT PRIMARY KEY,
+                bid REAL NOT NULL,
+                ask REAL NOT NULL,
+                volume INTEGER,
+                currency TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                ttl REAL NOT NULL)
+        '''
+        with self._conn() as conn:
+            # WAL lets readers in other processes keep reading while one process writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(create_quotes_table)
+
+    def _conn(self) -> sqlite3.Connection:
+        # The cache is only ever a shortcut so we wait a short time for locks rather than blocking the event loop
+        return sqlite3.connect(self.path, timeout=1)
+
+    def put(self, symbol: Symbol, symbol_data: SymbolData, ttl: Optional[float] = None) -> None:
+        self.put_many({symbol: symbol_data}, ttl=ttl)
+
+    def put_many(self, symbols_data: Dict[Symbol, SymbolData], ttl: Optional[float] = None) -> None:
+        if not symbols_data:
+            return
+        query = '''
+            INSERT OR REPLACE INTO quotes (symbol, bid, ask, volume, currency, fetched_at, ttl)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        '''
+        fetched_at = time.time()
+        ttl = self._max_age_seconds if ttl is None else ttl
+        values = [(symbol, d.bid, d.ask, d.volume, d.currency, fetched_at, ttl) for symbol, d in symbols_data.items()]
+        try:
+            conn = self._conn()
+            try:
+                with conn:
+                    conn.executemany(query, values)
+            finally:
+                conn.close()
+        except sqlite3.OperationalError as e:
+            logging.warning(f'could not write to quote cache: {e}')
+
+    def get(self, symbol: Symbol) -> Optional[SymbolData]:
+        return self.get_many([symbol]).get(symbol)
+
+    def get_many(self, symbols: Iterable[Symbol]) -> Dict[Symbol, SymbolData]:
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        placeholders = ', '.join('?' for _ in symbols)
+        query = f'''
+            SELECT symbol, bid, ask, volume, currency
+            FROM quotes
+            WHERE symbol IN ({placeholders}) AND fetched_at + ttl > ?
+        '''
+        try:
+            conn = self._conn()
+            try:
+                rows = conn.execute(query, (*symbols, time.time())).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.OperationalError as e:
+            logging.warning(f'could not read from quote cache: {e}')
+            return {}
+        return {Symbol(symbol): SymbolData(bid=bid, ask=ask, volume=volume, currency=currency)
+                for symbol, bid, ask, volume, currency in rows}
+
+    def purge(self) -> None:
+        conn = self._conn()
+        try:
+            with conn:
+                conn.execute('DELETE FROM quotes WHERE fetched_at + ttl <= ?', (time.time(),))
+        finally:
+            conn.close()
@@ -0,0 +1,133 @@
+"""
+This module renders images in a pool of worker processes so that a slow render never blocks the bot's event loop
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import pandas
+
+from . import utils
+from .std import RenderBusyError
+
+
+def render_portfolio(df: pandas.DataFrame, title: Optional[str], encoding: utils.Encoding) -> bytes:
+    return utils.df_to_image(df, title=title, encoding=encoding)
+
+
+def render_trades(df: pandas.DataFrame, title: Optional[str], encoding: utils.Encoding) -> bytes:
+    return utils.trades_to_table(df, title=title, encoding=encoding)
+
+
+def render_leaderboard(df: pandas.DataFrame, title: Optional[str], summary: pandas.DataFrame,
+                       encoding: utils.Encoding) -> bytes:
+    return utils.leaderboard_to_image(summary, df, title=title, encoding=encoding)
+
+
+def frame_key(kind: str, df: pandas.DataFrame, title: Optional[str], *other_dfs: pandas.DataFrame) -> str:
+    """
+    A key that only depends on what ends up in the image: the kind of render, the title and the frames' contents
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{kind}\0{title}'.encode())
+    for frame in (df, *other_dfs):
+        digest.update(f'\0{list(frame.columns)}'.encode())
+        digest.update(pandas.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    A least-recently-used cache of rendered images that holds at most [max_bytes] of image data
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._images: 'OrderedDict[str, bytes]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, key: str) -> Optional[bytes]:
+        if (image := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def put(self, key: str, image: bytes) -> None:
+        if len(image) > self.max_bytes:
+            return
+        if (old_image := self._images.pop(key, None)) is not None:
+            self.bytes -= len(old_image)
+        self._images[key] = image
+        self.bytes += len(image)
+        while self.bytes > self.max_bytes:
+            _key, evicted = self._images.popitem(last=False)
+            self.bytes -= len(evicted)
+
+
+class RenderPool:
+    """
+    A bounded pool of render worker processes that take frames and return PNG bytes. At most [max_pending] renders
+    may be queued or running at once; past that, render calls raise RenderBusyError right away instead of piling up.
+    Identical renders are answered from [cache] without going to a worker. Images are encoded with [encoding].
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 32,
+                 cache: Optional[RenderCache] = None, encoding: Optional[utils.Encoding] = None) -> None:
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.encoding = encoding if encoding is not None else utils.DEFAULT_ENCODING
+        self.max_pending = max_pending
+        self.pending = 0
+        self.cache = cache if cache is not None else RenderCache()
+        # Forking a process that is running an event loop (and its helper threads) is not safe, so start the workers
+        # from scratch
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                            mp_context=multiprocessing.get_context('spawn'))
+
+    async def _render(self, f, df: pandas.DataFrame, title: Optional[str], *other_dfs: pandas.DataFrame) -> bytes:
+        key = frame_key(f'{f.__name__} {self.encoding}', df, title, *other_dfs)
+        if (image := self.cache.get(key)) is not None:
+            logging.info(f'render cache hit for {f.__name__} {title}')
+            return image
+
+        if self.pending >= self.max_pending:
+            raise RenderBusyError(f'{self.pending} images are already being rendered')
+        self.pending += 1
+        try:
+            image = await asyncio.get_running_loop().run_in_executor(
+                self.executor, functools.partial(f, encoding=self.encoding), df, title, *other_dfs)
+        finally:
+            self.pending -= 1
+
+        self.cache.put(key, image)
+        return image
+
+    async def warm(self, df: pandas.DataFrame) -> None:
+        """
+        Have the workers render the portfolio [df], one render per worker and bypassing the cache, so that starting the
+        processes, importing the plotting libraries and loading fonts doesn't fall on the first real renders
+        """
+        loop = asyncio.get_running_loop()
+        render = functools.partial(render_portfolio, encoding=self.encoding)
+        await asyncio.gather(*(loop.run_in_executor(self.executor, render, df, None) for _ in range(self.max_workers)))
+
+    async def render_portfolio(self, df: pandas.DataFrame, title: Optional[str] = None) -> bytes:
+        return await self._render(render_portfolio, df, title)
+
+    async def render_trades(self, df: pandas.DataFrame, title: Optional[str] = None) -> bytes:
+        return await self._render(render_trades, df, title)
+
+    async def render_leaderboard(self, leaderboard: pandas.DataFrame, summary: pandas.DataFrame,
+                                 title: Optional[str] = None) -> bytes:
+        return await self._render(render_leaderboard, leaderboard, title, summary)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
@@ -3,18 +3,22 @@ This module is a script that send a summary to Guild that have this bot.
 Scheduling is done externally (with cron, for example).
 """
 
+import asyncio
+import io
 import logging
 import os
+import sys
 from datetime import datetime
 
 import click
 import discord
 import dotenv
 
-from cant_hide_money_bot import utils
 from .book import all_portfolios, filter_book_for_guild_id
-from .bot_common import find_channel, get_setting
-from .marketdata import MarketData
+from .bot_common import COMPACT_PORTFOLIOS, PORTFOLIOS_SETTING, find_channel, get_setting
+from .leaderboard import send_leaderboard
+from .marketdata import MarketData, create_cache
+from .render import RenderPool
 from .std import Mode
 from .store import Store
 
@@ -22,7 +26,6 @@ logging.basicConfig(format='%(asctime)-15s %(message)s', level=logging.INFO)
 
 dotenv.load_dotenv()
 DISCORD_TOKEN = os.environ['DISCORD_TOKEN']
-RAPID_API_KEY = os.environ['RAPID_API_KEY']
 DEV_GUILD_ID = int(os.environ['DEV_GUILD_ID'])
 
 client = discord.Client()
@@ -32,10 +35,12 @@ MODE: Mode
 
 @client.event
 async def on_ready():
-    market_data = MarketData(RAPID_API_KEY, MODE)
+    market_data = MarketData(MODE, cache=create_cache(MODE))
     store = Store(MODE)
     book = store.load_book()
     settings = store.load_settings()
+    # The reporter renders a whole guild at once and has nobody to tell to try again, so never reject renders
+    render_pool = RenderPool(max_pending=sys.maxsize)
     day = datetime.today().strftime('%A')
 
     for guild in client.guilds:
@@ -53,16 +58,21 @@ async def on_ready():
         if channel is None:
             raise Exception('Could not find a channel for sending the report')
 
-        book = filter_book_for_guild_id(book, guild.id)
-        portfolios = await all_portfolios(book, market_data)
+        guild_book = filter_book_for_guild_id(book, guild.id)
         await channel.send(f"Happy {day}, traders! Here's how we're doing:")
-        if len(portfolios):
-            for trader, portfolio in portfolios.items():
-                image_path = utils.df_to_image(portfolio, title=trader)
-                if image_path is not None:
-                    await channel.send(file=discord.File(image_path))
+        if not len(guild_book.index):
+            await channel.send('No positions -- get busy!')
+        elif get_setting(settings, guild.id, PORTFOLIOS_SETTING) == COMPACT_PORTFOLIOS:
+            await send_leaderboard(channel, guild_book, market_data, render_pool)
+        elif len(portfolios := await all_portfolios(guild_book, market_data)):
+            # Render every portfolio at once across the pool and then send them in order
+            pngs = await asyncio.gather(*(render_pool.render_portfolio(portfolio, title=trader)
+                                          for trader, portfolio in portfolios.items()))
+            filename = f'image.{render_pool.encoding.extension}'
+            for png in pngs:
+                await channel.send(file=discord.File(io.BytesIO(png), filename=filename))
         else:
-            channel.send('No positions -- get busy!')
+            await channel.send('No positions -- get busy!')
 
         await channel.send('Good luck out there!')
 
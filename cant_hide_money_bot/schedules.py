@@ -0,0 +1,47 @@
+"""
+This module defines recurring buys (dollar-cost averaging). Every schedule runs on slot boundaries so that all the
+schedules that are due together run in one batch, however many there are.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Union
+
+from .std import Dollars, Guild_id, Shares, Symbol, Trader
+
+INTERVALS = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+# Schedules only ever run at multiples of this from midnight
+SLOT = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class Schedule:
+    id: int
+    symbol: Symbol
+    qty: Union[Shares, Dollars]
+    interval: str  # One of INTERVALS
+    trader: Trader
+    guild_id: Guild_id
+    next_run: datetime
+
+
+def next_slot(time: datetime) -> datetime:
+    """
+    The first slot boundary strictly after [time]
+    """
+    midnight = time.replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight + ((time - midnight) // SLOT + 1) * SLOT
+
+
+def following_run(schedule: Schedule, now: datetime) -> datetime:
+    """
+    The next run of [schedule] after [now]. Runs that were missed (say, while the bot was down) are skipped rather than
+    run back to back.
+    """
+    interval = INTERVALS[schedule.interval]
+    missed = max(0, (now - schedule.next_run) // interval)
+    return schedule.next_run + (missed + 1) * interval
@@ -3,13 +3,18 @@ This module implements the bot that communicates with Discord
 """
 
 import asyncio
+import dataclasses
+import io
 import logging
 import math
+import multiprocessing
 import os
 import random
+import re
+import time
 from datetime import datetime
 from functools import wraps
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import click
 import discord
@@ -17,44 +22,111 @@ import dotenv
 import pandas
 from discord.ext import commands
 from pyrsistent import pmap
-from pyrsistent.typing import PMap
-
-from cant_hide_money_bot.book import all_portfolios, filter_book_for_guild_id, filter_book_for_trader, \
-    position_for_symbol, usd_for_trader
-from . import all_symbols, lessons, utils
-from .bot_common import get_setting, set_setting
-from .marketdata import MarketData
-from .std import Dir, Dollars, Guild_id, Mode, Shares, Symbol, Trade, TradeError, Trader, md
+
+from cant_hide_money_bot.book import all_portfolios, filter_book_for_guild_id, filter_book_for_symbol, \
+    filter_book_for_trader, position_for_symbol, trades_page, usd_for_trader
+from . import all_symbols, lessons, metrics, utils, warmup
+from .bot_common import COMPACT_PORTFOLIOS, PORTFOLIOS_SETTING, find_channel, get_setting, set_setting
+from .leaderboard import send_leaderboard
+from .marketdata import CircuitOpenError, MarketData, ReplayProvider, create_cache
+from .metrics import METRICS
+from .orders import Order, OrderBook, OrderType
+from .schedules import INTERVALS, Schedule, following_run, next_slot
+from .render import RenderPool
+from .std import Debouncer, Dir, Dollars, Guild_id, Mode, RenderBusyError, Settings, Shard, Shares, StoreBusyError, \
+    Symbol, SymbolData, Trade, TradeError, Trader, md
 from .store import Store
 
 logging.basicConfig(format='%(asctime)-15s %(message)s', level=logging.INFO)
 
-# Global variables that are set when this module is initialized
-# Maybe this should be a class so that initialization is done
-# explicitly via constructor
-MODE: Mode
-DEV_GUILD_ID: Guild_id
-BOOK: pandas.DataFrame
-SETTINGS: PMap[Guild_id, PMap[str, str]]
-STORE: Store
-MARKET_DATA: MarketData
+# How long a trader has to stop trading before they get their portfolio
+POST_TRADE_PORTFOLIO_DELAY_SECONDS = 2.
+
+# Commands wait at most this long after startup for the bot to warm up
+READY_TIMEOUT_SECONDS = 30.
+# Commands answered within this long count as fast
+FAST_RESPONSE_SECONDS = 1.
+
+
+class App:
+    """
+    Everything the bot works with while it runs: its store, market data and render pool, and the book, settings and
+    resting orders of the guilds it serves. When the bot runs as [shard], only the shard's guilds are loaded.
+    """
 
-# This lock is used to synchronize mutations to BOOK (the global variable)
-BOOK_LOCK = asyncio.Lock()
+    def __init__(self, mode: Mode, dev_guild_id: Guild_id, store: Store, market_data: MarketData,
+                 render_pool: RenderPool, shard: Optional[Shard] = None, state: Optional[warmup.State] = None,
+                 ready_timeout_seconds: float = READY_TIMEOUT_SECONDS, started_at: Optional[float] = None) -> None:
+        self.mode = mode
+        self.dev_guild_id = dev_guild_id
+        self.store = store
+        self.market_data = market_data
+        self.render_pool = render_pool
+        self.shard = shard
+        # [state] is the book, orders and settings when they have already been loaded (see warmup.load_state)
+        book, orders, settings = state if state is not None else (
+            store.load_book(shard=shard), store.load_orders(shard=shard), store.load_settings())
+        self.book = book
+        self.order_book = OrderBook(orders)
+        # This lock is used to synchronize mutations to the book
+        self.book_lock = asyncio.Lock()
+        # Set by the scheduler so that new schedules can wake it up
+        self.schedule_wakeup: Optional[asyncio.Event] = None
+        # Post-trade portfolios, coalesced per (guild, trader) so that a burst of trades renders once
+        self.portfolio_debouncer = Debouncer(POST_TRADE_PORTFOLIO_DELAY_SECONDS)
+        self.update_settings(settings)
+        # Set by run_bot while the bot warms up (see warmup.warm_up). Commands wait for it, but no longer than
+        # [ready_timeout_seconds] after [started_at].
+        self.warmup: Optional[asyncio.Task] = None
+        self.ready_timeout_seconds = ready_timeout_seconds
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        # How long after [started_at] the first command was answered within FAST_RESPONSE_SECONDS
+        self.first_fast_response: Optional[float] = None
+
+    def update_settings(self, settings: Settings) -> None:
+        """
+        Replace the settings with [settings] and recompute everything that is derived from them
+        """
+        self.settings = settings
+        # The name of the channel that gets money messages, for each guild that has them enabled, so that on_message
+        # doesn't have to look settings up for every message
+        self.money_message_channels = money_message_channels(settings)
+
+    async def wait_until_ready(self) -> None:
+        """
+        Wait for the warmup to finish, or for the readiness timeout to run out, whichever comes first
+        """
+        if self.warmup is None or self.warmup.done():
+            return
+        remaining = self.started_at + self.ready_timeout_seconds - time.perf_counter()
+        try:
+            # Shielded so that a command that gives up waiting doesn't cancel the warmup
+            await asyncio.wait_for(asyncio.shield(self.warmup), max(0., remaining))
+        except asyncio.TimeoutError:
+            pass
+
+    def record_response(self, seconds: float) -> None:
+        """
+        Report how long after startup the bot first answered a command within FAST_RESPONSE_SECONDS, given that a
+        command was just answered in [seconds]
+        """
+        if self.first_fast_response is None and seconds <= FAST_RESPONSE_SECONDS:
+            self.first_fast_response = time.perf_counter() - self.started_at
+            logging.info(f'first fast response {self.first_fast_response:.2f} s after startup')
+            METRICS.observe(metrics.STAGE, metrics.FIRST_FAST_RESPONSE, self.first_fast_response)
+
+
+# Set by run_bot
+APP: App
 
 bot = commands.Bot('!', description="~if you ain't talkin money i ain't talkin~")
 
 
-async def create_trade(symbol: Symbol, qty: Union[Shares, Dollars], dir_: Dir, trader: Trader, guild_id: Guild_id,
-                       time: datetime, clamp_qty: bool = False) -> Trade:
+def trade_from_quote(symbol: Symbol, symbol_data: Optional[SymbolData], qty: Union[Shares, Dollars], dir_: Dir,
+                     trader: Trader, guild_id: Guild_id, time: datetime, clamp_qty: bool = False) -> Trade:
     """
-    :clamp_qty: We do not allow trading less than 1 share or more that total volume / 2. When clamp_qty is True, we will
-    automatically limit quantities by those constraints (1 if qty < 1 and volume / 2 if greater). If clamp_qty is False,
-    we throw when outside of those bounds.
+    Price a trade of [qty] [symbol] off [symbol_data], its current quote. See create_trade for [clamp_qty].
     """
-    symbols_data = await MARKET_DATA.get_symbols_data([symbol], False)
-
-    symbol_data = symbols_data.get(symbol)
     if symbol_data is None:
         raise TradeError(f'could not get market data for symbol: {symbol}')
 
@@ -97,73 +169,217 @@ async def create_trade(symbol: Symbol, qty: Union[Shares, Dollars], dir_: Dir, t
         guild_id=guild_id)
 
 
-async def handle_trade(symbol: Symbol, qty: Union[Shares, Dollars], dir_: Dir, trader: Trader, guild,
-                       clamp_qty: bool = False) -> str:
+async def create_trade(symbol: Symbol, qty: Union[Shares, Dollars], dir_: Dir, trader: Trader, guild_id: Guild_id,
+                       time: datetime, clamp_qty: bool = False) -> Trade:
     """
-    Create a trade and put it on the book
+    :clamp_qty: We do not allow trading less than 1 share or more that total volume / 2. When clamp_qty is True, we will
+    automatically limit quantities by those constraints (1 if qty < 1 and volume / 2 if greater). If clamp_qty is False,
+    we throw when outside of those bounds.
+    """
+    symbols_data = await APP.market_data.get_symbols_data([symbol], False)
+    return trade_from_quote(symbol, symbols_data.get(symbol), qty, dir_, trader, guild_id, time, clamp_qty=clamp_qty)
+
+
+async def book_trades(trades: List[Trade], trader: Trader) -> None:
+    """
+    Persist [trades], all by [trader], and put them on the book. Raises a TradeError and books nothing if they would
+    leave [trader] short USD once all of them are booked. Cash is only checked at the end, so a sale can pay for a buy
+    that comes before it.
     """
-    global BOOK
 
-    # Create the trade
+    lock_requested = time.perf_counter()
+    async with APP.book_lock:
+        METRICS.observe(metrics.STAGE, metrics.LOCK_WAIT, time.perf_counter() - lock_requested)
+
+        # Check that the trades don't result in the trader having negative dollars
+        with METRICS.stage(metrics.LEDGER_UPDATE):
+            book_with_new_trades = APP.book.append([utils.dict_of_trade(trade) for trade in trades])
+            # Traders have separate cash in every guild
+            guild_book = filter_book_for_guild_id(book_with_new_trades, trades[0].guild_id)
+            resulting_usd = usd_for_trader(guild_book, trader)
+        if resulting_usd < 0:
+            raise TradeError(f'This {"trade" if len(trades) == 1 else "basket"} would result in you having '
+                             f'${resulting_usd:.2f}. You can not be short USD.')
+
+        # Persist the trades
+        with METRICS.stage(metrics.PERSIST):
+            APP.store.persist_trades(trades)
+
+        # Execute the trades by adding them to the book
+        APP.book = book_with_new_trades
+
+
+def trade_message(trade: Trade) -> str:
+    bought_or_sold = 'BOUGHT' if trade.dir_ == Dir.BUY else 'SOLD'
+    total_price = trade.qty * trade.price
+    return f'{bought_or_sold} {int(trade.qty)} {trade.symbol} @ ${trade.price} (${total_price:.2f})'
+
+
+async def handle_trade(symbol: Symbol, qty: Union[Shares, Dollars], dir_: Dir, trader: Trader, guild,
+                       clamp_qty: bool = False, symbol_data: Optional[SymbolData] = None) -> str:
+    """
+    Create a trade and put it on the book. The trade is priced off [symbol_data] when it is given and off a freshly
+    fetched quote otherwise.
+    """
     try:
-        trade = await create_trade(symbol, qty, dir_, trader, guild.id, datetime.now(), clamp_qty=clamp_qty)
+        if symbol_data is not None:
+            trade = trade_from_quote(symbol, symbol_data, qty, dir_, trader, guild.id, datetime.now(),
+                                     clamp_qty=clamp_qty)
+        else:
+            trade = await create_trade(symbol, qty, dir_, trader, guild.id, datetime.now(), clamp_qty=clamp_qty)
+        await book_trades([trade], trader)
     except TradeError as e:
         return str(e)
 
-    async with BOOK_LOCK:
-        # Check that the trade doesn't result in the trader having negative dollars
-        book_with_new_trade = BOOK.append([utils.dict_of_trade(trade)])
-        resulting_usd = usd_for_trader(book_with_new_trade, trader)
-        if resulting_usd < 0:
-            return f'This trade would result in you having ${resulting_usd:.2f}. You can not be short USD.'
+    response = trade_message(trade)
+    logging.info(response)
+    return response
 
-        # Persist the trade
-        STORE.persist_trade(trade)
 
-        # Execute the trade by adding it to the book
-        BOOK = book_with_new_trade
+async def handle_basket(legs: List[Tuple[Dir, Symbol, Union[Shares, Dollars]]], trader: Trader, guild) -> str:
+    """
+    Price every leg of a basket off one batch of quotes and book all of them or, if any leg fails, none of them. The
+    cash check runs on the USD left after all legs, so the basket's sales pay for its buys whatever their order.
+    """
+    symbols = list(dict.fromkeys(symbol for _dir, symbol, _qty in legs))
+    symbols_data = await APP.market_data.get_symbols_data(symbols, False)
+    now = datetime.now()
+    try:
+        trades = [trade_from_quote(symbol, symbols_data.get(symbol), qty, dir_, trader, guild.id, now)
+                  for dir_, symbol, qty in legs]
+        await book_trades(trades, trader)
+    except TradeError as e:
+        return f'Nothing was traded. {e}'
 
-    bought_or_sold = 'BOUGHT' if dir_ == Dir.BUY else 'SOLD'
-    total_price = trade.qty * trade.price
-    response = f'{bought_or_sold} {int(trade.qty)} {trade.symbol} @ ${trade.price} (${total_price:.2f})'
+    net = sum(trade.qty * trade.price * (-1 if trade.dir_ == Dir.BUY else 1) for trade in trades)
+    response = '\n'.join([trade_message(trade) for trade in trades] + [f'Net cash: ${net:.2f}'])
     logging.info(response)
     return response
 
 
 def mode_check(f):
     """
-    A decorator that ignores commands from all non-dev guilds when in dev mode
+    A decorator that ignores commands from all non-dev guilds when in dev mode, holds commands until the bot is warm
+    and records how long commands take
     """
 
     @wraps(f)
     async def wrapper(ctx, *args, **kwargs):
-        STORE.update_trader_info(ctx.author.id, ctx.author.name, str(ctx.author), ctx.guild.id)
-        if (MODE is Mode.PROD) or (ctx.guild.id == DEV_GUILD_ID):
-            return await f(ctx, *args, **kwargs)
+        try:
+            APP.store.update_trader_info(ctx.author.id, ctx.author.name, str(ctx.author), ctx.guild.id)
+        except StoreBusyError:
+            # Trader info is only used for display, so the next command can update it
+            logging.warning(f'could not update trader info for {ctx.author}: the database is busy')
+        if (APP.mode is Mode.PROD) or (ctx.guild.id == APP.dev_guild_id):
+            start = time.perf_counter()
+            with METRICS.timer(metrics.COMMAND, ctx.command.name if ctx.command is not None else f.__name__):
+                await APP.wait_until_ready()
+                try:
+                    result = await f(ctx, *args, **kwargs)
+                except StoreBusyError as e:
+                    await ctx.send(str(e))
+                    return
+            APP.record_response(time.perf_counter() - start)
+            return result
 
     return wrapper
 
 
-@bot.command(name='T', help='List trades')
+RENDER_BUSY_MESSAGE = "I'm swamped drawing pictures right now -- try again in a few seconds."
+
+
+async def send_image(ctx, render, content: Optional[str] = None) -> None:
+    """
+    Await [render] (an APP.render_pool call) and send the resulting PNG, or tell the user to try again when the render
+    pool is saturated
+    """
+    try:
+        with METRICS.stage(metrics.RENDER):
+            png = await render
+    except RenderBusyError as e:
+        logging.warning(f'render pool busy: {e}')
+        await ctx.send(RENDER_BUSY_MESSAGE)
+        return
+    with METRICS.stage(metrics.UPLOAD):
+        filename = f'image.{APP.render_pool.encoding.extension}'
+        await ctx.send(content, file=discord.File(io.BytesIO(png), filename=filename))
+
+
+TRADES_PER_PAGE = 20
+
+
+@bot.command(name='T', help='List trades, newest first: !T [page] [symbol] [@trader]')
 @mode_check
-async def trades(ctx) -> None:
-    image_path = utils.trades_to_table(BOOK)
-    await ctx.send(file=discord.File(image_path))
+async def trades(ctx, *args: str) -> None:
+    page = 1
+    book = filter_book_for_guild_id(APP.book, ctx.guild.id)
+    filters = []
+    mentions = {str(member.id): member for member in ctx.message.mentions}
+    for arg in args:
+        if arg.isdigit():
+            page = int(arg)
+        elif (member := mentions.get(arg.strip('<@!>'))) is not None:
+            book = filter_book_for_trader(book, str(member))
+            filters.append(str(member))
+        else:
+            book = filter_book_for_symbol(book, Symbol(arg))
+            filters.append(Symbol(arg))
+
+    if not len(book.index):
+        await ctx.send('No trades -- get busy!')
+        return
+
+    try:
+        page_of_trades, num_pages = trades_page(book, page, TRADES_PER_PAGE)
+    except ValueError as e:
+        await ctx.send(str(e))
+        return
+
+    # Pages count back from the newest trade, so every new trade in the guild shifts every page and misses the render
+    # cache. The cache only serves the same page viewed again before the next trade. The number of pages stays out of
+    # the title so that it doesn't add misses of its own.
+    title = ' '.join(['Trades', *filters, f'page {page}'])
+    await send_image(ctx, APP.render_pool.render_trades(page_of_trades, title=title),
+                     content=f'Page {page}/{num_pages}')
+
+
+# Discord rejects messages longer than this
+MAX_MESSAGE_LENGTH = 2000
+
+# Set the "output" setting to "text" to get portfolios as text tables instead of images
+OUTPUT_SETTING = 'output'
+TEXT_OUTPUT = 'text'
+
+
+async def send_portfolio(ctx, portfolio: pandas.DataFrame, title: str) -> None:
+    if get_setting(APP.settings, ctx.guild.id, OUTPUT_SETTING) == TEXT_OUTPUT:
+        # Start the code block with a newline so that Discord doesn't take the title for a language
+        message = md(f'\n{utils.df_to_text(portfolio, title=title)}')
+        if len(message) <= MAX_MESSAGE_LENGTH:
+            await ctx.send(message)
+            return
+    await send_image(ctx, APP.render_pool.render_portfolio(portfolio, title=title))
 
 
 async def send_trader_portfolio(ctx) -> None:
     trader = str(ctx.author)
-    book = filter_book_for_guild_id(BOOK, ctx.guild.id)
+    book = filter_book_for_guild_id(APP.book, ctx.guild.id)
     book = filter_book_for_trader(book, trader)
-    portfolios = await all_portfolios(book, MARKET_DATA)
+    portfolios = await all_portfolios(book, APP.market_data)
     if (portfolio := portfolios.get(trader)) is not None:
-        image_path = utils.df_to_image(portfolio, title=trader)
-        if image_path is not None:
-            await ctx.send(file=discord.File(image_path))
+        await send_portfolio(ctx, portfolio, trader)
     else:
         await ctx.send('No positions -- get busy!')
 
 
+def schedule_trader_portfolio(ctx) -> None:
+    """
+    Send the portfolio of the author of [ctx] once they have stopped trading for a moment, so that a burst of trades
+    is only followed by one portfolio, and that portfolio is the up-to-date one
+    """
+    APP.portfolio_debouncer.call((ctx.guild.id, str(ctx.author)), lambda: send_trader_portfolio(ctx))
+
+
 @bot.command(name='$', help='Print your own portfolio')
 @mode_check
 async def trader_portfolio(ctx) -> None:
@@ -173,15 +389,21 @@ async def trader_portfolio(ctx) -> None:
 @bot.command(name='$$', help='Print all portfolios per trader and the fund portfolio')
 @mode_check
 async def all_portfolios_(ctx) -> None:
-    b = filter_book_for_guild_id(BOOK, ctx.guild.id)
-    portfolios = await all_portfolios(b, MARKET_DATA)
+    b = filter_book_for_guild_id(APP.book, ctx.guild.id)
+    if len(b.index) and get_setting(APP.settings, ctx.guild.id, PORTFOLIOS_SETTING) == COMPACT_PORTFOLIOS:
+        try:
+            await send_leaderboard(ctx, b, APP.market_data, APP.render_pool)
+        except RenderBusyError as e:
+            logging.warning(f'render pool busy: {e}')
+            await ctx.send(RENDER_BUSY_MESSAGE)
+        return
+
+    portfolios = await all_portfolios(b, APP.market_data)
     if len(portfolios):
         for trader, portfolio in portfolios.items():
-            image_path = utils.df_to_image(portfolio, title=trader)
-            if image_path is not None:
-                await ctx.send(file=discord.File(image_path))
+            await send_portfolio(ctx, portfolio, trader)
     else:
-        ctx.send('No positions -- get busy!')
+        await ctx.send('No positions -- get busy!')
 
 
 def parse_qty(qty: str):
@@ -204,28 +426,112 @@ async def parse_qty_and_send_error_message(qty, ctx):
         raise e
 
 
+def unknown_symbol_message(symbol: Symbol) -> str:
+    message = f'{symbol} is not a symbol I know about.'
+    if suggestions := all_symbols.suggest(symbol):
+        message += f' Did you mean one of: {", ".join(suggestions)}?'
+    return message
+
+
+async def check_symbol_and_send_error_message(symbol: Symbol, ctx) -> bool:
+    """
+    Accept symbols in the universe right away. Anything else (ETFs, crypto, new listings) is only rejected, with
+    suggestions, once the quote provider has no quote for it either.
+    """
+    if all_symbols.is_known_symbol(symbol):
+        return True
+    try:
+        if symbol in await APP.market_data.get_symbols_data([symbol], use_cache=True):
+            return True
+    except CircuitOpenError:
+        # The symbol may well be fine: let the trade report that the market data API is down
+        return True
+    except TradeError as e:
+        logging.info(f'no quote for unknown symbol {symbol}: {e}')
+    await ctx.send(unknown_symbol_message(symbol))
+    return False
+
+
 @bot.command(name='BUY', help='Buy some shares')
 @mode_check
 async def buy(ctx, symbol: str, qty: str) -> None:
     """Here and in sell below we don't type annotate qty because we want to send a useful message when its not a float
     """
     symbol = Symbol(symbol)
+    if not await check_symbol_and_send_error_message(symbol, ctx):
+        return
     qty = await parse_qty_and_send_error_message(qty, ctx)
     trader = Trader(ctx.author)
     response = await handle_trade(symbol, qty, Dir.BUY, trader, ctx.guild)
     await ctx.send(response)
-    await send_trader_portfolio(ctx)
+    schedule_trader_portfolio(ctx)
 
 
 @bot.command(name='SELL', help='Sell some shares')
 @mode_check
 async def sell(ctx, symbol: str, qty: str) -> None:
     symbol = Symbol(symbol)
+    if not await check_symbol_and_send_error_message(symbol, ctx):
+        return
     qty = await parse_qty_and_send_error_message(qty, ctx)
     trader = Trader(ctx.author)
     response = await handle_trade(symbol, qty, Dir.SELL, trader, ctx.guild)
     await ctx.send(response)
-    await send_trader_portfolio(ctx)
+    schedule_trader_portfolio(ctx)
+
+
+MAX_BASKET_LEGS = 20
+
+
+def parse_basket(args: List[str]) -> List[Tuple[Dir, Symbol, Union[Shares, Dollars]]]:
+    """
+    Parse basket arguments like BUY AAPL 10 MSFT $500 SELL TSLA 5 into (direction, symbol, qty) legs. A direction
+    applies to every leg after it until the next direction. BUY and SELL are always read as directions, so symbols
+    named BUY or SELL can't be traded in a basket (use !BUY and !SELL for them).
+    """
+    legs = []
+    dir_ = None
+    i = 0
+    while i < len(args):
+        word = args[i].upper()
+        if word in Dir.__members__:
+            dir_ = Dir[word]
+            i += 1
+            continue
+        if dir_ is None:
+            raise ValueError(f'Start the basket with BUY or SELL, not {args[i]}')
+        if i + 1 >= len(args):
+            raise ValueError(f'{args[i]} needs a quantity')
+        try:
+            qty = parse_qty(args[i + 1])
+        except ValueError:
+            raise ValueError(f'Invalid quantity "{args[i + 1]}" for {args[i]}')
+        legs.append((dir_, Symbol(word), qty))
+        i += 2
+
+    if not legs:
+        raise ValueError('The basket is empty')
+    if len(legs) > MAX_BASKET_LEGS:
+        raise ValueError(f'A basket can have at most {MAX_BASKET_LEGS} legs')
+    return legs
+
+
+@bot.command(name='BASKET', help='Trade several symbols, all or nothing: !BASKET BUY AAPL 10 MSFT $500 SELL TSLA 5 '
+             '(cash is checked after all legs, and BUY and SELL are always directions, never symbols)')
+@mode_check
+async def basket(ctx, *args: str) -> None:
+    try:
+        legs = parse_basket(list(args))
+    except ValueError as e:
+        await ctx.send(str(e))
+        return
+    for _dir, symbol, _qty in legs:
+        if not await check_symbol_and_send_error_message(symbol, ctx):
+            return
+    trader = Trader(ctx.author)
+    response = await handle_basket(legs, trader, ctx.guild)
+    await ctx.send(response)
+    schedule_trader_portfolio(ctx)
 
 
 @bot.command(name='CLOSE', help='Sell some shares')
@@ -233,7 +539,7 @@ async def sell(ctx, symbol: str, qty: str) -> None:
 async def close(ctx, symbol: str) -> None:
     trader = Trader(ctx.author)
     symbol = Symbol(symbol)
-    current_position = position_for_symbol(BOOK, trader, symbol)
+    current_position = position_for_symbol(filter_book_for_guild_id(APP.book, ctx.guild.id), trader, symbol)
 
     if current_position == 0:
         await ctx.send(f'You do not have a position in {symbol}')
@@ -243,7 +549,353 @@ async def close(ctx, symbol: str) -> None:
     qty = Shares(abs(current_position))
     response = await handle_trade(symbol, qty, dir_, trader, ctx.guild)
     await ctx.send(response)
-    await send_trader_portfolio(ctx)
+    schedule_trader_portfolio(ctx)
+
+
+# How often to refresh the quotes of symbols with resting orders
+ORDER_REFRESH_SECONDS = 60
+MAX_ORDERS_PER_TRADER = 25
+
+# Keep references to the order executions in flight so that they aren't garbage collected
+_order_tasks = set()
+
+
+def order_description(order: Order) -> str:
+    qty = f'${order.qty:.2f}' if isinstance(order.qty, Dollars) else f'{int(order.qty)}'
+    return f'{order.type_.name} {order.dir_.name} {qty} {order.symbol} @ ${order.price:.2f}'
+
+
+async def notify_guild(guild_id: Guild_id, message: str) -> None:
+    """
+    Send [message] to the guild's bot channel, when there is one
+    """
+    guild = bot.get_guild(guild_id)
+    channel_name = get_setting(APP.settings, guild_id, 'channel')
+    if guild is None or channel_name is None or (channel := find_channel(guild, channel_name)) is None:
+        logging.info(f'nowhere to send message for guild {guild_id}: {message}')
+        return
+    await channel.send(message)
+
+
+def rest_order_again(order: Order) -> str:
+    """
+    Put [order], whose trade could not be booked because the database was busy, back on the order book so that the
+    next quote that triggers it tries again. It was already deleted from the store, so it is persisted again, maybe
+    under a new id; if the database is still busy it only rests in memory until the bot restarts. Returns what
+    happened.
+    """
+    logging.warning(f'could not execute order {order.id}: the database is busy')
+    try:
+        rested = APP.store.persist_order(order)
+    except StoreBusyError:
+        logging.warning(f'could not persist order {order.id} again: it rests in memory until the bot restarts')
+        APP.order_book.add(order)
+        return 'the database is busy, so it will try again on the next quote but is lost if the bot restarts'
+    APP.order_book.add(rested)
+    return f'the database is busy, so it will try again on the next quote as order {rested.id}'
+
+
+async def execute_orders(triggered: List[Tuple[Order, SymbolData]]) -> None:
+    """
+    Book the trades of the [triggered] orders. An order whose trade is rejected is cancelled; one that only failed
+    because the database was busy rests again.
+    """
+    for order, symbol_data in triggered:
+        # Forget the order before trading so that it can never execute twice
+        try:
+            APP.store.delete_order(order.id)
+        except StoreBusyError:
+            # Keep the order resting so that the next quote that triggers it tries again
+            logging.warning(f'could not execute order {order.id}: the database is busy')
+            APP.order_book.add(order)
+            continue
+        try:
+            trade = trade_from_quote(order.symbol, symbol_data, order.qty, order.dir_, order.trader, order.guild_id,
+                                     datetime.now())
+            await book_trades([trade], order.trader)
+        except StoreBusyError:
+            response = rest_order_again(order)
+        except TradeError as e:
+            response = f'cancelled: {e}'
+        else:
+            response = trade_message(trade)
+            logging.info(response)
+        await notify_guild(order.guild_id, f'{order.trader} order {order.id} ({order_description(order)}): {response}')
+
+
+def on_quotes(symbols_data: Dict[Symbol, SymbolData]) -> None:
+    """
+    A MarketData listener that executes the resting orders that fresh quotes trigger
+    """
+    triggered = [(order, symbol_data) for symbol, symbol_data in symbols_data.items()
+                 for order in APP.order_book.pop_triggered(symbol, symbol_data)]
+    if triggered:
+        task = asyncio.get_running_loop().create_task(execute_orders(triggered))
+        _order_tasks.add(task)
+        task.add_done_callback(_order_tasks.discard)
+
+
+async def check_orders() -> None:
+    """
+    Get the quotes of every symbol with resting orders in one batch and execute the orders they trigger. Cached quotes
+    go through on_quotes too: with a shared cache they may have been fetched by another process, so this one has never
+    seen them. Quotes that were just fetched went through on_quotes already, which does nothing the second time.
+    """
+    if symbols := APP.order_book.symbols():
+        on_quotes(await APP.market_data.get_symbols_data(symbols, use_cache=True))
+
+
+async def refresh_order_quotes() -> None:
+    """
+    Check the resting orders every ORDER_REFRESH_SECONDS
+    """
+    while True:
+        await asyncio.sleep(ORDER_REFRESH_SECONDS)
+        try:
+            await check_orders()
+        except Exception as e:
+            logging.warning(f'could not refresh quotes for resting orders: {e}')
+
+
+async def place_order(ctx, type_: OrderType, dir_: str, symbol: str, qty: str, price: str) -> None:
+    if dir_.upper() not in Dir.__members__:
+        await ctx.send(f'Usage: !{type_.name} BUY|SELL symbol qty price')
+        return
+    symbol = Symbol(symbol)
+    if not await check_symbol_and_send_error_message(symbol, ctx):
+        return
+    qty = await parse_qty_and_send_error_message(qty, ctx)
+    try:
+        price = float(price.lstrip('$').replace(',', ''))
+    except ValueError:
+        await ctx.send(f'Invalid price "{price}"')
+        return
+    if price <= 0:
+        await ctx.send('The price has to be positive')
+        return
+
+    trader = Trader(ctx.author)
+    if len(APP.order_book.for_trader(trader, ctx.guild.id)) >= MAX_ORDERS_PER_TRADER:
+        await ctx.send(f'You can have at most {MAX_ORDERS_PER_TRADER} open orders. !CANCEL some first.')
+        return
+
+    order = APP.store.persist_order(Order(id=0, type_=type_, symbol=symbol, dir_=Dir[dir_.upper()], qty=qty,
+                                          price=price, trader=trader, guild_id=ctx.guild.id, time=datetime.now()))
+    APP.order_book.add(order)
+    await ctx.send(f'Placed order {order.id}: {order_description(order)}')
+
+    # The order may already be marketable. A fresh quote goes through on_quotes by itself and checking a cached one
+    # again is harmless since triggered orders leave the order book.
+    on_quotes(await APP.market_data.get_symbols_data([symbol], use_cache=True))
+
+
+@bot.command(name='LIMIT', help='Buy or sell at a price or better: !LIMIT BUY|SELL symbol qty price')
+@mode_check
+async def limit(ctx, dir_: str, symbol: str, qty: str, price: str) -> None:
+    await place_order(ctx, OrderType.LIMIT, dir_, symbol, qty, price)
+
+
+@bot.command(name='STOP', help='Buy or sell once the price moves through a price: !STOP BUY|SELL symbol qty price')
+@mode_check
+async def stop(ctx, dir_: str, symbol: str, qty: str, price: str) -> None:
+    await place_order(ctx, OrderType.STOP, dir_, symbol, qty, price)
+
+
+@bot.command(name='ORDERS', help='List your open limit and stop orders')
+@mode_check
+async def orders_(ctx) -> None:
+    if open_orders := APP.order_book.for_trader(Trader(ctx.author), ctx.guild.id):
+        lines = [f'{order.id:>6} {order_description(order)}' for order in sorted(open_orders, key=lambda o: o.id)]
+        await ctx.send(md('\n'.join(lines)))
+    else:
+        await ctx.send('No open orders')
+
+
+@bot.command(name='CANCEL', help='Cancel one of your open orders: !CANCEL order_id')
+@mode_check
+async def cancel(ctx, order_id: int) -> None:
+    order = APP.order_book.orders.get(order_id)
+    if order is None or order.trader != Trader(ctx.author) or order.guild_id != ctx.guild.id:
+        await ctx.send(f'You have no open order {order_id}')
+        return
+    APP.order_book.remove(order_id)
+    APP.store.delete_order(order_id)
+    await ctx.send(f'Cancelled order {order_id}: {order_description(order)}')
+
+
+MAX_SCHEDULES_PER_TRADER = 10
+# How long the scheduler waits before running due schedules again after they failed
+SCHEDULE_RETRY_SECONDS = 10
+
+
+def price_schedules(schedules: List[Schedule], symbols_data: Dict[Symbol, SymbolData], now: datetime,
+                    results: Dict[Guild_id, List[str]]) -> Dict[int, Trade]:
+    """
+    Price a buy for each of [schedules] by schedule id. Schedules that can't trade get a line in [results] instead.
+    """
+    trades = {}
+    for schedule in schedules:
+        try:
+            trades[schedule.id] = trade_from_quote(schedule.symbol, symbols_data.get(schedule.symbol), schedule.qty,
+                                                   Dir.BUY, schedule.trader, schedule.guild_id, now)
+        except TradeError as e:
+            results.setdefault(schedule.guild_id, []).append(f'{schedule.trader} {schedule_description(schedule)}: {e}')
+    return trades
+
+
+async def schedule_quotes(symbols: List[Symbol]) -> Dict[Symbol, SymbolData]:
+    """
+    Fresh quotes for [symbols] in one batch. One symbol without a valid quote (say, a delisted one) fails the whole
+    batch, so when the batch fails, fetch the symbols one by one and leave out the ones that fail.
+    """
+    try:
+        return await APP.market_data.get_symbols_data(symbols, False)
+    except Exception as e:
+        logging.warning(f'could not get quotes for scheduled buys in one batch, getting them one by one: {e}')
+    results = await asyncio.gather(*(APP.market_data.get_symbols_data([symbol], False) for symbol in symbols),
+                                   return_exceptions=True)
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            logging.warning(f'could not get a quote for scheduled buys of {symbol}: {result}')
+    return {symbol: symbol_data for result in results if not isinstance(result, Exception)
+            for symbol, symbol_data in result.items()}
+
+
+def unaffordable_schedules(book: pandas.DataFrame, trades: Dict[int, Trade]) -> List[int]:
+    """
+    The ids of the schedules whose [trades] their traders can't afford on top of [book]. Each trader's trades are
+    admitted in schedule id order until their USD in that guild runs out; that one and the rest are not.
+    """
+    usd: Dict[Tuple[Guild_id, Trader], float] = {}
+    unaffordable = []
+    for schedule_id, trade in sorted(trades.items()):
+        key = (trade.guild_id, trade.trader)
+        if key not in usd:
+            # Traders have separate cash in every guild
+            usd[key] = usd_for_trader(filter_book_for_guild_id(book, trade.guild_id), trade.trader)
+        resulting_usd = usd[key] + trade.qty * trade.price * (-1 if trade.dir_ == Dir.BUY else 1)
+        if resulting_usd < 0:
+            # Later schedules don't jump the queue by being cheaper
+            usd[key] = -math.inf
+            unaffordable.append(schedule_id)
+        else:
+            usd[key] = resulting_usd
+    return unaffordable
+
+
+async def run_schedules(schedules: List[Schedule], now: datetime) -> None:
+    """
+    Run every due schedule in one batch: one quote fetch for all of their symbols, one lock acquisition and one
+    transaction for all of the trades and the schedules' next runs. A trader who can't afford all of their buys gets
+    them in schedule id order until their USD runs out, without holding up anyone else.
+    """
+
+    symbols_data = await schedule_quotes(sorted({schedule.symbol for schedule in schedules}))
+    results: Dict[Guild_id, List[str]] = {}
+    trades = price_schedules(schedules, symbols_data, now, results)
+
+    lock_requested = time.perf_counter()
+    async with APP.book_lock:
+        METRICS.observe(metrics.STAGE, metrics.LOCK_WAIT, time.perf_counter() - lock_requested)
+
+        with METRICS.stage(metrics.LEDGER_UPDATE):
+            unaffordable = set(unaffordable_schedules(APP.book, trades))
+            for schedule in schedules:
+                if schedule.id in unaffordable:
+                    del trades[schedule.id]
+                    results.setdefault(schedule.guild_id, []).append(
+                        f'{schedule.trader} {schedule_description(schedule)}: not enough USD')
+            book_with_new_trades = APP.book.append([utils.dict_of_trade(trade) for trade in trades.values()])
+
+        with METRICS.stage(metrics.PERSIST):
+            APP.store.persist_schedule_runs(
+                list(trades.values()),
+                [dataclasses.replace(schedule, next_run=following_run(schedule, now)) for schedule in schedules])
+
+        APP.book = book_with_new_trades
+
+    for trade in trades.values():
+        results.setdefault(trade.guild_id, []).append(f'{trade.trader} {trade_message(trade)}')
+    for guild_id, lines in results.items():
+        await notify_guild(guild_id, md('\n'.join(['Scheduled buys', *lines])))
+
+
+async def run_scheduler() -> None:
+    """
+    Sleep until the earliest schedule is due, then run every due schedule. Since schedules run on slot boundaries, the
+    scheduler wakes at most once per slot however many schedules there are.
+    """
+    APP.schedule_wakeup = asyncio.Event()
+    while True:
+        APP.schedule_wakeup.clear()
+        next_run = APP.store.next_schedule_run(shard=APP.shard)
+        now = datetime.now()
+        if next_run is not None and next_run <= now:
+            if due := APP.store.load_due_schedules(now, shard=APP.shard):
+                logging.info(f'running {len(due)} scheduled buys')
+                try:
+                    await run_schedules(due, now)
+                except Exception:
+                    logging.exception('could not run scheduled buys')
+                    # The schedules are still due: try again in a moment rather than right away
+                    await asyncio.sleep(SCHEDULE_RETRY_SECONDS)
+            continue
+
+        timeout = (next_run - now).total_seconds() if next_run is not None else None
+        try:
+            await asyncio.wait_for(APP.schedule_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+def schedule_description(schedule: Schedule) -> str:
+    qty = f'${schedule.qty:.2f} of' if isinstance(schedule.qty, Dollars) else f'{int(schedule.qty)}'
+    return f'{schedule.interval} buy of {qty} {schedule.symbol}'
+
+
+@bot.command(name='DCA', help=f'Buy a symbol on a schedule: !DCA symbol qty {"|".join(INTERVALS)}')
+@mode_check
+async def dca(ctx, symbol: str, qty: str, interval: str) -> None:
+    symbol = Symbol(symbol)
+    if not await check_symbol_and_send_error_message(symbol, ctx):
+        return
+    qty = await parse_qty_and_send_error_message(qty, ctx)
+    if (interval := interval.lower()) not in INTERVALS:
+        await ctx.send(f'The interval has to be one of: {", ".join(INTERVALS)}')
+        return
+
+    trader = Trader(ctx.author)
+    if len(APP.store.load_schedules(trader, ctx.guild.id)) >= MAX_SCHEDULES_PER_TRADER:
+        await ctx.send(f'You can have at most {MAX_SCHEDULES_PER_TRADER} schedules. !UNSCHEDULE some first.')
+        return
+
+    schedule = APP.store.persist_schedule(Schedule(id=0, symbol=symbol, qty=qty, interval=interval, trader=trader,
+                                                   guild_id=ctx.guild.id, next_run=next_slot(datetime.now())))
+    if APP.schedule_wakeup is not None:
+        APP.schedule_wakeup.set()
+    await ctx.send(f'Scheduled {schedule.id}: {schedule_description(schedule)}, starting {schedule.next_run}')
+
+
+@bot.command(name='SCHEDULES', help='List your scheduled buys')
+@mode_check
+async def schedules_(ctx) -> None:
+    if schedules := APP.store.load_schedules(Trader(ctx.author), ctx.guild.id):
+        lines = [f'{schedule.id:>6} {schedule_description(schedule)}, next {schedule.next_run}'
+                 for schedule in schedules]
+        await ctx.send(md('\n'.join(lines)))
+    else:
+        await ctx.send('No scheduled buys')
+
+
+@bot.command(name='UNSCHEDULE', help='Stop one of your scheduled buys: !UNSCHEDULE schedule_id')
+@mode_check
+async def unschedule(ctx, schedule_id: int) -> None:
+    schedules = {schedule.id: schedule for schedule in APP.store.load_schedules(Trader(ctx.author), ctx.guild.id)}
+    if (schedule := schedules.get(schedule_id)) is None:
+        await ctx.send(f'You have no schedule {schedule_id}')
+        return
+    APP.store.delete_schedule(schedule_id)
+    await ctx.send(f'Unscheduled {schedule_id}: {schedule_description(schedule)}')
 
 
 @bot.command(name='IM-FEELING-LUCKY', help='Buy or sell a random quantity of a random symbol')
@@ -255,13 +907,22 @@ async def im_feeling_lucky(ctx) -> None:
     trader = Trader(ctx.author)
     response = await handle_trade(symbol, qty, dir_, trader, ctx.guild, clamp_qty=True)
     await ctx.send(response)
-    await send_trader_portfolio(ctx)
+    schedule_trader_portfolio(ctx)
+
+
+@bot.command(name='SEARCH', help='Find symbols that start with a prefix')
+@mode_check
+async def search(ctx, prefix: str) -> None:
+    if matches := all_symbols.search(prefix, limit=25):
+        await ctx.send(md('\n'.join(matches)))
+    else:
+        await ctx.send(f'No symbols start with {prefix.upper()}')
 
 
 @bot.command(name='SETTINGS', help="See your server's settings")
 @mode_check
 async def get_settings(ctx) -> None:
-    guild_settings = SETTINGS.get(ctx.guild.id, pmap())
+    guild_settings = APP.settings.get(ctx.guild.id, pmap())
     lines = [f'{key} = {value}' for key, value in guild_settings.items()]
     message = '\n'.join(lines)
     await ctx.send(md(message))
@@ -270,19 +931,17 @@ async def get_settings(ctx) -> None:
 @bot.command(name='SET-SETTING', help='Set a setting')
 @mode_check
 async def set_setting_(ctx, key: str, value: str) -> None:
-    global SETTINGS
     guild_id = ctx.guild.id
-    SETTINGS = set_setting(SETTINGS, guild_id, key, value)
-    STORE.set_setting(guild_id, key, value)
+    APP.update_settings(set_setting(APP.settings, guild_id, key, value))
+    APP.store.set_setting(guild_id, key, value)
     await ctx.send(md(f'Updated settings: {key} = {value}'))
 
 
 def set_money_message_settings(guild_id, value):
-    global SETTINGS
     key = 'money_message'
     value = str(value)
-    SETTINGS = set_setting(SETTINGS, guild_id, key, value)
-    STORE.set_setting(guild_id, key, value)
+    APP.update_settings(set_setting(APP.settings, guild_id, key, value))
+    APP.store.set_setting(guild_id, key, value)
 
 
 @bot.command(name='DISABLE-MONEY-MESSAGE', help='Disable the "did someone say...money ??" message')
@@ -299,6 +958,14 @@ async def disable_money_message(ctx) -> None:
     await ctx.send('Enabled money message')
 
 
+@bot.command(name='STATS', help='Command and stage latencies since the bot started (admins only)')
+@commands.has_permissions(administrator=True)
+@mode_check
+async def stats(ctx) -> None:
+    for kind in (metrics.COMMAND, metrics.STAGE):
+        await ctx.send(md(METRICS.summary(kind)[:MAX_MESSAGE_LENGTH - len(md(''))]))
+
+
 @bot.command(name='ELI5', help='A quick lesson on trading')
 @mode_check
 async def eli5(ctx) -> None:
@@ -312,58 +979,135 @@ async def on_ready() -> None:
         logging.info(f'{bot.user} connected to: {guild.name}(id: {guild.id})')
 
 
+MONEY_WORDS = ['money', 'bread', 'dough', 'cheese', 'cheddar',
+               'bones', 'clams', 'guap', 'moola', 'smackers', 'bands', 'paper']
+MONEY_WORD_PATTERN = re.compile('|'.join(map(re.escape, MONEY_WORDS)), re.IGNORECASE)
+
+
 def find_money_word(message: str) -> Optional[str]:
-    money_words = ['money', 'bread', 'dough', 'cheese', 'cheddar',
-                   'bones', 'clams', 'guap', 'moola', 'smackers', 'bands', 'paper']
-    return next((word for word in money_words if word in message.lower()), None)
+    """
+    Return the first money word that appears anywhere in [message], lowercased
+    """
+    if (match := MONEY_WORD_PATTERN.search(message)) is not None:
+        return match.group(0).lower()
+    return None
 
 
 def str_to_bool(s):
     return s.lower() == 'true'
 
 
+def money_message_channels(settings: Settings) -> Dict[Guild_id, str]:
+    """
+    Map every guild that has money messages enabled (the default) and a channel set to the name of that channel
+    """
+    channels = {}
+    for guild_id in settings:
+        channel = get_setting(settings, guild_id, 'channel')
+        if channel is not None and get_setting(settings, guild_id, 'money_message', f=str_to_bool, default=True):
+            channels[guild_id] = channel
+    return channels
+
+
 @bot.event
 async def on_message(message) -> None:
     # The bot should not react to its own messages
     if message.author == bot.user:
         return
 
-    money_message_enabled = get_setting(SETTINGS, message.guild.id, 'money_message', f=str_to_bool, default=True)
-    if money_message_enabled:
-        channel_setting = get_setting(SETTINGS, message.guild.id, 'channel')
-        if channel_setting == message.channel.name:
-            # When someone mentions money in the cant-hide-money-bot-designated channel, assert your presence
-            if (money_word := find_money_word(message.content)) is not None:
-                await message.channel.send(f'did someone say...{money_word} ?? 👀')
+    # Direct messages have no guild and so no money message channel
+    if message.guild is not None and APP.money_message_channels.get(message.guild.id) == message.channel.name:
+        # When someone mentions money in the cant-hide-money-bot-designated channel, assert your presence
+        if (money_word := find_money_word(message.content)) is not None:
+            await message.channel.send(f'did someone say...{money_word} ?? 👀')
 
     await bot.process_commands(message)
 
 
-@click.command()
-@click.option('--mode', type=click.Choice(['dev', 'prod']), required=True)
-def main(mode) -> None:
-    global DEV_GUILD_ID
-    global MODE
-    global BOOK
-    global STORE
-    global SETTINGS
-    global MARKET_DATA
+def use_shard(bot_: commands.Bot, shard: Shard) -> None:
+    """
+    Make [bot_] identify to Discord as [shard], so that it only gets the events of the shard's guilds. discord.py copies
+    the shard count into the connection state, where the gateway reads it from, only when the client is built, so set it
+    there too. That state is private, which is why setup.py pins discord.py to 1.7.
+    """
+    bot_.shard_id = shard.id
+    bot_.shard_count = shard.count
+    bot_._connection.shard_count = shard.count
+
+
+def run_bot(mode: str, replay_quotes: Optional[str], render_workers: Optional[int],
+            shard: Optional[Shard] = None, ready_timeout: float = READY_TIMEOUT_SECONDS) -> None:
+    """
+    Set up APP and run the bot, as [shard] when it is given. The bot warms up while it connects, and commands wait
+    for it for at most [ready_timeout] seconds after startup.
+    """
+    global APP
 
+    started_at = time.perf_counter()
     dotenv.load_dotenv()
     token = os.environ['DISCORD_TOKEN']
-    rapid_api_key = os.environ['RAPID_API_KEY']
 
-    # Set globals
-    DEV_GUILD_ID = int(os.environ['DEV_GUILD_ID'])
-    MODE = Mode[mode.upper()]
-    MARKET_DATA = MarketData(rapid_api_key, MODE)
-    STORE = Store(MODE)
-    BOOK = STORE.load_book()
-    SETTINGS = STORE.load_settings()
+    mode_ = Mode[mode.upper()]
+    if replay_quotes is not None:
+        # Replayed quotes stay in this process: the shared cache is where the reporter and the JSON API get real prices
+        market_data = MarketData(mode_, provider=ReplayProvider.from_file(replay_quotes))
+    else:
+        # Shards share quotes through the cache on disk so that a quote one of them fetched serves all of them
+        market_data = MarketData(mode_, cache=create_cache(mode_, shared=shard is not None))
+    store = Store(mode_)
+    state = bot.loop.run_until_complete(warmup.load_state(store, shard))
+    APP = App(mode_, int(os.environ['DEV_GUILD_ID']), store, market_data, RenderPool(max_workers=render_workers),
+              shard=shard, state=state, ready_timeout_seconds=ready_timeout, started_at=started_at)
+    APP.warmup = bot.loop.create_task(
+        warmup.warm_up(APP.book, APP.order_book.symbols(), market_data, APP.render_pool))
+    market_data.add_listener(on_quotes)
+    bot.loop.create_task(refresh_order_quotes())
+    bot.loop.create_task(run_scheduler())
+
+    if shard is not None:
+        logging.info(f'running as shard {shard.id} of {shard.count}')
+        use_shard(bot, shard)
+
+    # Serve metrics on localhost when asked to, one port per shard
+    if (metrics_port := os.environ.get('METRICS_PORT')) is not None:
+        bot.loop.create_task(metrics.serve(METRICS, int(metrics_port) + (shard.id if shard is not None else 0)))
 
     # Start the bot
     bot.run(token)
 
 
+@click.command()
+@click.option('--mode', type=click.Choice(['dev', 'prod']), required=True)
+@click.option('--replay-quotes', type=click.Path(exists=True, dir_okay=False),
+              help='Serve quotes from a replay file (see marketdata.ReplayProvider) instead of the market data API '
+                   '(dev mode only)')
+@click.option('--render-workers', type=int, default=None,
+              help='Number of processes that render images (defaults to the number of cores, split between shards)')
+@click.option('--shards', type=int, default=None,
+              help='Run this many bot processes, each connected as one Discord shard and serving its share of guilds')
+@click.option('--ready-timeout', type=float, default=READY_TIMEOUT_SECONDS, show_default=True,
+              help='Seconds after startup that commands wait for the bot to warm up (0 to not wait)')
+def main(mode, replay_quotes, render_workers, shards, ready_timeout) -> None:
+    if replay_quotes is not None and mode == 'prod':
+        # Trades priced off replayed quotes must never end up in the production ledger
+        raise click.UsageError('--replay-quotes only works with --mode dev')
+    if shards is None:
+        run_bot(mode, replay_quotes, render_workers, ready_timeout=ready_timeout)
+        return
+
+    if render_workers is None:
+        render_workers = max(1, (os.cpu_count() or 1) // shards)
+    # Each shard starts from scratch with its own bot and event loop
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=run_bot,
+                                 args=(mode, replay_quotes, render_workers, Shard(shard_id, shards), ready_timeout),
+                                 name=f'shard-{shard_id}')
+                 for shard_id in range(shards)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
 if __name__ == '__main__':
     main()
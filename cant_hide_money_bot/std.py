@@ -2,11 +2,12 @@
 This module contains the core types and classes used throughout the app
 """
 import asyncio
+import logging
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, unique
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Set
 
 from pyrsistent.typing import PMap, PVector
 
@@ -68,6 +69,15 @@ class Mode(Enum):
     PROD = 2
 
 
+class Shard(NamedTuple):
+    id: int
+    count: int
+
+    def owns(self, guild_id: Guild_id) -> bool:
+        # This is how Discord assigns guilds to shards
+        return (guild_id >> 22) % self.count == self.id
+
+
 class TradeError(Exception):
     pass
 
@@ -76,6 +86,18 @@ class NoPositionsError(Exception):
     pass
 
 
+class RenderBusyError(Exception):
+    pass
+
+
+class StoreBusyError(TradeError):
+    """
+    The database stayed locked by another process for longer than the store waits. Nothing was written, so the request
+    can be retried.
+    """
+    pass
+
+
 USD = Symbol('USD')
 
 
@@ -98,12 +120,60 @@ class TimedCache:
             return value_and_time[0]
         return None
 
+    def put_many(self, values: Dict[Any, Any]) -> None:
+        for key, value in values.items():
+            self.put(key, value)
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        self._purge()
+        return {key: value_and_time[0] for key in keys if (value_and_time := self._cache.get(key)) is not None}
+
     def _purge(self):
         current_time = time.time()
         self._cache = {key: (value, insert_time) for key, (value, insert_time) in self._cache.items()
                        if (current_time - insert_time) < self._max_age_seconds}
 
 
+class Debouncer:
+    """
+    Coalesces bursts of calls per key: call(key, f) runs only the last [f] given for [key], once no other call for
+    [key] has come in for [delay_seconds]. Runs that have started are never cancelled.
+    """
+
+    def __init__(self, delay_seconds: float) -> None:
+        self.delay_seconds = delay_seconds
+        # The waiting task for each key
+        self._waiting: Dict[Hashable, asyncio.Task] = {}
+        # Waiting and running tasks, so that they can be drained (and aren't garbage collected)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._waiting)
+
+    def call(self, key: Hashable, f: Callable[[], Awaitable[None]]) -> None:
+        if (waiting := self._waiting.get(key)) is not None:
+            waiting.cancel()
+        task = asyncio.get_running_loop().create_task(self._run(key, f))
+        self._waiting[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, f: Callable[[], Awaitable[None]]) -> None:
+        await asyncio.sleep(self.delay_seconds)
+        del self._waiting[key]
+        try:
+            await f()
+        except Exception:
+            logging.exception(f'debounced call for {key} failed')
+
+    async def drain(self) -> None:
+        """
+        Wait for every waiting and running call to finish
+        """
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
 def dir_to_mult(dir_: Dir) -> int:
     if dir_ == Dir.BUY:
         return 1
@@ -3,20 +3,28 @@ This module provides functionality for serializing, deserializing,
 loading, and persisting trades
 """
 
+import dataclasses
 import logging
 import sqlite3
 from collections import defaultdict
 from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import DefaultDict, Dict, Optional
+from typing import DefaultDict, Dict, List, Optional, Tuple
 
 import pandas
 from pyrsistent import pmap
 
-from .std import Guild_id, Mode, Settings, Trade
+from .orders import Order, OrderType
+from .schedules import Schedule
+from .std import Dir, Dollars, Guild_id, Mode, Settings, Shard, Shares, StoreBusyError, Symbol, Trade, Trader
 
 DEFAULT_DIR = Path.home() / '.cant-hide-money-bot'
 
+# Store calls run on the bot's event loop, so a write only waits this long for another process's write to finish
+# before giving up with a StoreBusyError rather than freezing every other command
+BUSY_TIMEOUT_SECONDS = 1
+
 
 def db_path(mode: Mode) -> str:
     db_name = Path(f'data.{mode.name.lower()}.db')
@@ -28,20 +36,66 @@ def db_conn(db):
     # In [in_memory] mode, you have to use a single connection throughout
     # but in regular mode, you should not since this is a multithreaded application
     if type(db) == sqlite3.Connection:
-        yield db
+        # Still commit (or roll back) so that one write doesn't hold the database locked
+        with db:
+            yield db
     else:
-        conn = sqlite3.connect(db)
+        # Several processes (bot shards, the reporter, the JSON API) share the database so wait a little for each
+        # other's writes rather than failing right away
+        conn = sqlite3.connect(db, timeout=BUSY_TIMEOUT_SECONDS)
         try:
             with conn:
                 yield conn
+        except sqlite3.OperationalError as e:
+            if 'locked' in str(e) or 'busy' in str(e):
+                raise StoreBusyError('The database is busy -- try again in a few seconds.') from e
+            raise
         finally:
             conn.close()
 
 
+def shard_filter(shard: Optional[Shard]) -> Tuple[str, tuple]:
+    """
+    A WHERE condition (and its parameters) that selects the rows of [shard]'s guilds, or every row without a shard
+    """
+    if shard is None:
+        return '1', ()
+    return '(guild_id >> 22) % ? = ?', (shard.count, shard.id)
+
+
+def insert_trades(cursor: sqlite3.Cursor, trades: List[Trade]) -> None:
+    query = '''
+        INSERT INTO trades (symbol, dir, qty, time, price, trader, guild_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+    values = [(
+        trade.symbol,
+        trade.dir_.name,
+        trade.qty,
+        str(trade.time),
+        trade.price,
+        trade.trader,
+        trade.guild_id,
+    ) for trade in trades]
+    cursor.executemany(query, values)
+
+
+def schedule_of_row(row: tuple) -> Schedule:
+    id_, symbol, qty, dollars, interval, trader, guild_id, next_run = row
+    return Schedule(id=id_, symbol=Symbol(symbol), qty=Dollars(qty) if dollars else Shares(qty), interval=interval,
+                    trader=trader, guild_id=guild_id, next_run=datetime.fromisoformat(next_run))
+
+
+SCHEDULE_COLUMNS = 'id, symbol, qty, dollars, interval, trader, guild_id, next_run'
+
+
 class Store:
     def __init__(self, mode: Mode, in_memory=False) -> None:
+        self.in_memory = in_memory
         if in_memory:
-            self.db = sqlite3.connect('file::memory:?cache=shared')
+            # A private database per store, so that in-memory stores don't see each other's trades. Its single
+            # connection must only be used from the thread that created it (see warmup.load_state).
+            self.db = sqlite3.connect(':memory:')
         else:
             DEFAULT_DIR.mkdir(parents=True, exist_ok=True)
             self.db = db_path(mode)
@@ -74,37 +128,165 @@ class Store:
                 guild_id INTEGER NOT NULL,
                 UNIQUE(id, guild_id))
         '''
+        create_orders_table = '''
+            CREATE TABLE IF NOT EXISTS orders (
+                id INTEGER PRIMARY KEY,
+                type TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                dir TEXT NOT NULL,
+                qty REAL NOT NULL,
+                dollars INTEGER NOT NULL,
+                price REAL NOT NULL,
+                trader TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                time TEXT NOT NULL)
+        '''
+        create_schedules_table = '''
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INTEGER PRIMARY KEY,
+                symbol TEXT NOT NULL,
+                qty REAL NOT NULL,
+                dollars INTEGER NOT NULL,
+                interval TEXT NOT NULL,
+                trader TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                next_run TEXT NOT NULL)
+        '''
+        # The scheduler only ever asks for the earliest and the due schedules
+        create_schedules_index = 'CREATE INDEX IF NOT EXISTS schedules_next_run ON schedules (next_run)'
         with db_conn(self.db) as conn:
             cursor = conn.cursor()
+            if not in_memory:
+                # WAL lets readers in other processes keep reading while one process writes
+                cursor.execute('PRAGMA journal_mode=WAL')
             cursor.execute(create_trades_table)
             cursor.execute(create_settings_table)
             cursor.execute(create_traders_table)
+            cursor.execute(create_orders_table)
+            cursor.execute(create_schedules_table)
+            cursor.execute(create_schedules_index)
 
-    def load_book(self) -> pandas.DataFrame:
-        query = '''
+    def load_book(self, shard: Optional[Shard] = None) -> pandas.DataFrame:
+        where, params = shard_filter(shard)
+        query = f'''
             SELECT symbol, dir, qty, time, price, trader, guild_id
             FROM trades
+            WHERE {where}
         '''
         with db_conn(self.db) as conn:
-            return pandas.read_sql(query, conn, parse_dates=['time'])
+            return pandas.read_sql(query, conn, params=params, parse_dates=['time'])
 
     def persist_trade(self, trade: Trade) -> None:
+        self.persist_trades([trade])
+
+    def persist_trades(self, trades: List[Trade]) -> None:
+        """
+        Persist [trades] in one transaction: either all of them are stored or none are
+        """
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            insert_trades(cursor, trades)
+
+    def persist_order(self, order: Order) -> Order:
+        """
+        Persist [order] and return it with the id it was stored under
+        """
+        query = '''
+            INSERT INTO orders (type, symbol, dir, qty, dollars, price, trader, guild_id, time)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        values = (
+            order.type_.name,
+            order.symbol,
+            order.dir_.name,
+            order.qty,
+            isinstance(order.qty, Dollars),
+            order.price,
+            order.trader,
+            order.guild_id,
+            str(order.time),
+        )
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, values)
+            return dataclasses.replace(order, id=cursor.lastrowid)
+
+    def load_orders(self, shard: Optional[Shard] = None) -> List[Order]:
+        where, params = shard_filter(shard)
+        query = f'''
+            SELECT id, type, symbol, dir, qty, dollars, price, trader, guild_id, time
+            FROM orders
+            WHERE {where}
+        '''
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            return [Order(id=id_, type_=OrderType[type_], symbol=Symbol(symbol), dir_=Dir[dir_],
+                          qty=Dollars(qty) if dollars else Shares(qty), price=price, trader=trader,
+                          guild_id=guild_id, time=datetime.fromisoformat(time))
+                    for id_, type_, symbol, dir_, qty, dollars, price, trader, guild_id, time
+                    in cursor.execute(query, params)]
+
+    def delete_order(self, order_id: int) -> None:
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM orders WHERE id = ?', (order_id,))
+
+    def persist_schedule(self, schedule: Schedule) -> Schedule:
+        """
+        Persist [schedule] and return it with the id it was stored under
+        """
         query = '''
-            INSERT INTO trades (symbol, dir, qty, time, price, trader, guild_id)
+            INSERT INTO schedules (symbol, qty, dollars, interval, trader, guild_id, next_run)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         '''
         values = (
-            trade.symbol,
-            trade.dir_.name,
-            trade.qty,
-            str(trade.time),
-            trade.price,
-            trade.trader,
-            trade.guild_id,
+            schedule.symbol,
+            schedule.qty,
+            isinstance(schedule.qty, Dollars),
+            schedule.interval,
+            schedule.trader,
+            schedule.guild_id,
+            str(schedule.next_run),
         )
         with db_conn(self.db) as conn:
             cursor = conn.cursor()
             cursor.execute(query, values)
+            return dataclasses.replace(schedule, id=cursor.lastrowid)
+
+    def load_schedules(self, trader: Trader, guild_id: Guild_id) -> List[Schedule]:
+        query = f'SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE trader = ? AND guild_id = ? ORDER BY id'
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            return [schedule_of_row(row) for row in cursor.execute(query, (trader, guild_id))]
+
+    def load_due_schedules(self, now: datetime, shard: Optional[Shard] = None) -> List[Schedule]:
+        where, params = shard_filter(shard)
+        query = f'SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE next_run <= ? AND {where}'
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            return [schedule_of_row(row) for row in cursor.execute(query, (str(now), *params))]
+
+    def next_schedule_run(self, shard: Optional[Shard] = None) -> Optional[datetime]:
+        where, params = shard_filter(shard)
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            (next_run,) = cursor.execute(f'SELECT MIN(next_run) FROM schedules WHERE {where}', params).fetchone()
+            return datetime.fromisoformat(next_run) if next_run is not None else None
+
+    def persist_schedule_runs(self, trades: List[Trade], schedules: List[Schedule]) -> None:
+        """
+        Persist the [trades] that a run of [schedules] made and the schedules' next runs, in one transaction
+        """
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            insert_trades(cursor, trades)
+            cursor.executemany('UPDATE schedules SET next_run = ? WHERE id = ?',
+                               [(str(schedule.next_run), schedule.id) for schedule in schedules])
+
+    def delete_schedule(self, schedule_id: int) -> None:
+        with db_conn(self.db) as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM schedules WHERE id = ?', (schedule_id,))
 
     def set_setting(self, guild: Guild_id, key: str, value: str):
         query = '''
@@ -1,11 +1,22 @@
 import functools
-import tempfile
+import html
+import io
+import itertools
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Optional
 
 import imgkit
 import matplotlib
+import matplotlib.font_manager
+import matplotlib.ticker
 import numpy as np
-import pandas as pd
-from PIL import Image
+import tabulate
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image, ImageDraw, ImageFont
 
 from . import book
 
@@ -46,57 +57,255 @@ table_styles = [
 ]
 
 
-def trades_to_table(df):
-    df = df[[book.SYMBOL, book.DIR, book.QTY, book.TRADE_PRICE, book.TRADER, book.TIME]]
-    dollar_format = '${:20,.2f}'.format
-    df[book.TRADE_PRICE] = df[book.TRADE_PRICE].map(dollar_format)
-    styler = df.reset_index(drop=True).style.hide_index().set_table_styles(table_styles)
-    html = styler.render()
-    fd, filename = tempfile.mkstemp(suffix='.png')
-    imgkit.from_string(html, filename, options={'quiet': '', 'width': 600, 'disable-smart-width': ''})
-    return filename
-
-
-def df_to_table(df, title=None):
-    df = df.copy(deep=True)
-
-    styler = df.reset_index(drop=True).style
-    styler.hide_index()
-
-    def format_maybe_nan(template):
-        def f(n):
-            if np.isnan(n):
-                return ''
-            else:
-                return template.format(n)
-        return f
-
-    dollar_format = format_maybe_nan('${:20,.2f}')
-
-    styler.format(formatter={
-        book.SHARES: format_maybe_nan('{:.0f}'),
-        book.VALUE: dollar_format,
-        book.AVG_COST: dollar_format,
-        book.CURRENT_PRICE: dollar_format,
-        book.MARK_PNL: dollar_format,
-        book.RETURN: format_maybe_nan('{:5,.2f}%')
-    })
-    styler.set_table_styles(table_styles)
-    if title is not None:
-        styler = styler.set_caption(title)
+# Table renderers: NATIVE draws the table in-process with PIL, IMGKIT renders HTML with a wkhtmltoimage subprocess
+NATIVE = 'native'
+IMGKIT = 'imgkit'
+TABLE_RENDERER = os.getenv('TABLE_RENDERER', NATIVE)
+
+HEADER_BACKGROUND = '#DFDFDF'
+ALT_ROW_BACKGROUND = '#F5F5F5'
+NEGATIVE_BACKGROUND = '#ffa1a1'
+ROW_HEIGHT = 30
+CELL_PADDING = 10
+MARGIN = 8
+FONT_SIZE = 15
+
+
+@functools.lru_cache(maxsize=None)
+def font(bold: bool = False) -> ImageFont.FreeTypeFont:
+    # Matplotlib ships DejaVu Sans so we can count on it being installed
+    weight = 'bold' if bold else 'normal'
+    path = matplotlib.font_manager.findfont(matplotlib.font_manager.FontProperties(family='DejaVu Sans', weight=weight))
+    return ImageFont.truetype(path, FONT_SIZE)
 
-    def style_negative(value):
-        if value < 0:
-            return 'background-color:#ffa1a1'
+
+def format_maybe_nan(template):
+    def f(n):
+        if np.isnan(n):
+            return ''
         else:
-            return None
+            return template.format(n)
+    return f
+
+
+dollar_format = format_maybe_nan('${:20,.2f}')
+
+portfolio_formatters = {
+    book.SHARES: format_maybe_nan('{:.0f}'),
+    book.VALUE: dollar_format,
+    book.AVG_COST: dollar_format,
+    book.CURRENT_PRICE: dollar_format,
+    book.MARK_PNL: dollar_format,
+    book.RETURN: format_maybe_nan('{:5,.2f}%')
+}
+
+trade_formatters = {
+    book.TRADE_PRICE: '${:20,.2f}'.format,
+}
+
+
+def format_cell(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def format_cells(df, formatters):
+    """
+    Format every cell of [df] as a string, column by column. Runs of whitespace are collapsed like HTML does.
+    """
+    return [[' '.join((formatters[column](value) if column in formatters else format_cell(value)).split())
+             for value in df[column]] for column in df.columns]
+
+
+def df_to_text(df, title=None) -> str:
+    """
+    A plain-text version of df_to_table for monospace output
+    """
+    cells = format_cells(df.reset_index(drop=True), portfolio_formatters)
+    rows = list(zip(*cells))
+    table = tabulate.tabulate(rows, headers=list(df.columns), tablefmt='simple', disable_numparse=True,
+                              colalign=['left'] + ['right'] * (len(df.columns) - 1))
+    return table if title is None else f'{title}\n{table}'
+
+
+def draw_table(df, formatters, negative_columns=(), title=None, min_width=0) -> Image.Image:
+    """
+    Draw [df] the way our HTML table styles render it: a bold grey header, centered cells, alternating row colors and
+    a red background for negative values in [negative_columns]
+    """
+    columns = list(df.columns)
+    cells = format_cells(df, formatters)
+    header_font = font(bold=True)
+    body_font = font()
+
+    # Size every column to its widest cell
+    column_widths = [
+        max([header_font.getlength(str(column))] + [body_font.getlength(cell) for cell in column_cells])
+        + 2 * CELL_PADDING
+        for column, column_cells in zip(columns, cells)]
+    table_width = int(sum(column_widths))
+    caption_height = ROW_HEIGHT if title is not None else 0
+    width = max(min_width, table_width + 2 * MARGIN)
+    height = caption_height + ROW_HEIGHT * (len(df.index) + 1) + 2 * MARGIN
+
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+
+    if title is not None:
+        draw.text((MARGIN + table_width / 2, MARGIN + ROW_HEIGHT / 2), str(title), fill='black', font=body_font,
+                  anchor='mm')
+
+    def draw_row(y, texts, row_font, background=None, backgrounds=None):
+        x = MARGIN
+        for i, (text, column_width) in enumerate(zip(texts, column_widths)):
+            cell_background = backgrounds[i] if backgrounds is not None and backgrounds[i] is not None else background
+            if cell_background is not None:
+                draw.rectangle([x, y, x + column_width - 1, y + ROW_HEIGHT - 1], fill=cell_background)
+            draw.text((x + column_width / 2, y + ROW_HEIGHT / 2), text, fill='black', font=row_font,
+                      anchor='mm')
+            x += column_width
+
+    y = MARGIN + caption_height
+    draw_row(y, [str(column) for column in columns], header_font, background=HEADER_BACKGROUND)
+
+    negative = [df[column].to_numpy() < 0 if column in negative_columns else None for column in columns]
+    for row in range(len(df.index)):
+        y += ROW_HEIGHT
+        backgrounds = [NEGATIVE_BACKGROUND if is_negative is not None and is_negative[row] else None
+                       for is_negative in negative]
+        draw_row(y, [column_cells[row] for column_cells in cells], body_font,
+                 background=ALT_ROW_BACKGROUND if row % 2 else None, backgrounds=backgrounds)
+
+    return image
+
+
+# Image encodings for the images we upload to Discord
+PNG = 'png'
+# A PNG with an adaptive 256 color palette. Our tables and charts use a handful of colors so this looks the same as a
+# full color PNG at a fraction of the size.
+PALETTE_PNG = 'png8'
+WEBP = 'webp'
+IMAGE_FORMATS = (PNG, PALETTE_PNG, WEBP)
+
+
+@dataclass(frozen=True)
+class Encoding:
+    image_format: str = PNG
+    # When set, images are scaled down until they encode to at most this many bytes
+    max_bytes: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Fail when the encoding is made rather than in a render worker on the first command
+        if self.image_format not in IMAGE_FORMATS:
+            raise ValueError(f'unsupported image format {self.image_format!r}, use one of {", ".join(IMAGE_FORMATS)}')
+
+    @property
+    def extension(self) -> str:
+        """
+        The file extension for images in this encoding. Discord picks how to preview an upload from its extension.
+        """
+        return 'webp' if self.image_format == WEBP else 'png'
+
+
+def encoding_from_env() -> Encoding:
+    """
+    The encoding that IMAGE_FORMAT and IMAGE_MAX_BYTES ask for. Raises a ValueError that names the setting when either
+    is invalid, so that a bad setting stops the bot at startup.
+    """
+    try:
+        image_format = os.getenv('IMAGE_FORMAT', PALETTE_PNG)
+        max_bytes = int(value) if (value := os.getenv('IMAGE_MAX_BYTES')) is not None else None
+        return Encoding(image_format=image_format, max_bytes=max_bytes)
+    except ValueError as e:
+        raise ValueError(f'invalid IMAGE_FORMAT or IMAGE_MAX_BYTES: {e}') from e
+
+
+DEFAULT_ENCODING = encoding_from_env()
+
+
+def encode_image_once(image: Image.Image, image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    # PNG's optimize flag is left off: it makes encoding several times slower for a few percent smaller images
+    if image_format == PNG:
+        image.save(buffer, format='PNG')
+    elif image_format == PALETTE_PNG:
+        # Median cut keeps subtle colors like the alternating row background that the faster octree method loses
+        image.convert('RGB').quantize(colors=256, method=Image.MEDIANCUT).save(buffer, format='PNG')
+    elif image_format == WEBP:
+        image.save(buffer, format='WEBP', lossless=True)
+    else:
+        raise ValueError(f'unsupported image format: {image_format}')
+    return buffer.getvalue()
+
+
+def encode_image(image: Image.Image, encoding: Optional[Encoding] = None) -> bytes:
+    encoding = encoding if encoding is not None else DEFAULT_ENCODING
+    data = encode_image_once(image, encoding.image_format)
+    # Encoded size is roughly proportional to the number of pixels, so scale both sides by the square root of how far
+    # over budget we are (and a little more so that we don't creep up on it)
+    while encoding.max_bytes is not None and len(data) > encoding.max_bytes and min(image.size) > 1:
+        scale = 0.9 * math.sqrt(encoding.max_bytes / len(data))
+        image = image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))), Image.LANCZOS)
+        data = encode_image_once(image, encoding.image_format)
+    return data
+
+
+def html_to_image(html: str, options) -> Image.Image:
+    # Passing False as the output path makes imgkit return the image instead of writing it to a file
+    return Image.open(io.BytesIO(imgkit.from_string(html, False, options=options)))
+
+
+# The table styles compiled to CSS once, for df_to_html
+table_css = '\n'.join(
+    f"{style['selector']} {{ {'; '.join(f'{prop}: {value}' for prop, value in style['props'])} }}"
+    for style in table_styles)
+
+
+def df_to_html(df, formatters, negative_columns=(), title=None) -> str:
+    """
+    Write [df] as an HTML table that looks like the one pandas' Styler produces with our table styles, straight from
+    the column arrays
+    """
+    columns = list(df.columns)
+    cells = format_cells(df, formatters)
+    negative_style = f' style="background-color:{NEGATIVE_BACKGROUND}"'
+    cell_styles = [np.where(df[column].to_numpy() < 0, negative_style, '') if column in negative_columns
+                   else itertools.repeat('') for column in columns]
+
+    header = ''.join(f'<th>{html.escape(str(column))}</th>' for column in columns)
+    rows = '\n'.join(
+        '<tr>' + ''.join(f'<td{style}>{html.escape(cell)}</td>' for cell, style in row) + '</tr>'
+        for row in zip(*(zip(column_cells, column_styles) for column_cells, column_styles in zip(cells, cell_styles))))
+    caption = f'<caption>{html.escape(str(title))}</caption>' if title is not None else ''
+    return (f'<style type="text/css">\n{table_css}\n</style>\n'
+            f'<table>{caption}<thead><tr>{header}</tr></thead>\n<tbody>\n{rows}\n</tbody></table>')
+
+
+def trades_to_table(df, title=None, renderer=None, encoding=None) -> bytes:
+    renderer = renderer if renderer is not None else TABLE_RENDERER
+    df = df[[book.SYMBOL, book.DIR, book.QTY, book.TRADE_PRICE, book.TRADER, book.TIME]]
 
-    styler.applymap(style_negative, subset=pd.IndexSlice[:, [book.MARK_PNL, book.RETURN]])
+    if renderer == NATIVE:
+        image = draw_table(df.reset_index(drop=True), trade_formatters, title=title, min_width=600)
+        return encode_image(image, encoding)
 
-    html = styler.render()
-    fd, filename = tempfile.mkstemp(suffix='.png')
-    imgkit.from_string(html, filename, options=imgkit_options)
-    return filename
+    table_html = df_to_html(df, trade_formatters, title=title)
+    return encode_image(html_to_image(table_html, options={'quiet': '', 'width': 600, 'disable-smart-width': ''}),
+                        encoding)
+
+
+def df_to_table(df, title=None, renderer=None) -> Image.Image:
+    renderer = renderer if renderer is not None else TABLE_RENDERER
+
+    if renderer == NATIVE:
+        negative_columns = (book.MARK_PNL, book.RETURN)
+        image = draw_table(df.reset_index(drop=True), portfolio_formatters, negative_columns=negative_columns,
+                           title=title, min_width=imgkit_options['width'])
+        return image
+
+    table_html = df_to_html(df, portfolio_formatters, negative_columns=(book.MARK_PNL, book.RETURN), title=title)
+    return html_to_image(table_html, options=imgkit_options)
 
 
 def format_df_for_chart(df):
@@ -109,30 +318,29 @@ def format_df_for_chart(df):
     return df
 
 
-def df_to_exposure_plot(df):
-    df = df.copy(deep=True)
-    df = format_df_for_chart(df)
+def figure_to_image(figure) -> Image.Image:
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png')
+    buffer.seek(0)
+    return Image.open(buffer)
 
-    # Only create the plot if there are rows for security positions
-    if not len(df.index):
-        return None
 
-    # Sort and create a bar chart
-    plot = df.sort_values(book.VALUE).plot.barh(x=book.SYMBOL, y=book.VALUE, rot=0)
-    # Format dollar axis
-    tick = matplotlib.ticker.StrMethodFormatter('${x:,.0f}')
-    plot.get_xaxis().set_major_formatter(tick)
-    matplotlib.pyplot.xticks(rotation=25)
-    matplotlib.pyplot.tick_params(axis='y', which='major', labelsize=6)
-    matplotlib.pyplot.title('Exposure')
-    _fd, chart_filename = tempfile.mkstemp(suffix='.png')
-    plot.figure.savefig(chart_filename)
+# Figures are reused between renders instead of going through pyplot, which keeps every figure it creates alive until
+# it is closed. Each thread gets its own figures so concurrent renders never draw on the same one.
+_figures = threading.local()
 
-    return chart_filename
 
+def reusable_figure(name: str) -> Figure:
+    figures = _figures.__dict__.setdefault('figures', {})
+    if (figure := figures.get(name)) is None:
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        figures[name] = figure
+    figure.clear()
+    return figure
 
-def df_to_return_plot(df):
-    df = df.copy(deep=True)
+
+def bar_chart(df, column, title, formatter):
     df = format_df_for_chart(df)
 
     # Only create the plot if there are rows for security positions
@@ -140,39 +348,72 @@ def df_to_return_plot(df):
         return None
 
     # Sort and create a bar chart
-    plot = df.sort_values(book.RETURN).plot.barh(x=book.SYMBOL, y=book.RETURN, rot=0)
-    plot.get_xaxis().set_major_formatter(matplotlib.ticker.PercentFormatter())
-    matplotlib.pyplot.xticks(rotation=25)
-    matplotlib.pyplot.tick_params(axis='y', which='major', labelsize=6)
-    matplotlib.pyplot.title('Return')
-    _fd, chart_filename = tempfile.mkstemp(suffix='.png')
-    plot.figure.savefig(chart_filename)
-    matplotlib.pyplot.close()
+    df = df.sort_values(column)
+    positions = np.arange(len(df.index))
+    figure = reusable_figure(title)
+    plot = figure.add_subplot()
+    plot.barh(positions, df[column], height=0.5, label=column)
+    plot.set_yticks(positions)
+    plot.set_yticklabels(df[book.SYMBOL])
+    plot.set_ylabel(book.SYMBOL)
+    plot.xaxis.set_major_formatter(formatter)
+    plot.tick_params(axis='x', labelrotation=25)
+    plot.tick_params(axis='y', which='major', labelsize=6)
+    plot.set_title(title)
+    plot.legend()
+
+    return figure_to_image(figure)
 
-    return chart_filename
 
+def df_to_exposure_plot(df):
+    # Format dollar axis
+    return bar_chart(df, book.VALUE, 'Exposure', matplotlib.ticker.StrMethodFormatter('${x:,.0f}'))
 
-def df_to_image(df, title=None) -> str:
-    table_filename = df_to_table(df, title=title)
-    exposure_plot_filename = df_to_exposure_plot(df)
-    return_plot_filename = df_to_return_plot(df)
 
-    # Stitch images together
-    images = [
-        Image.open(table_filename),
-        Image.open(exposure_plot_filename),
-        Image.open(return_plot_filename)
-    ]
+def df_to_return_plot(df):
+    return bar_chart(df, book.RETURN, 'Return', matplotlib.ticker.PercentFormatter())
+
+
+def stitch(images) -> Image.Image:
+    """
+    Stack [images] on top of each other
+    """
     widths, heights = zip(*(i.size for i in images))
     max_width = max(widths)
     total_height = sum(heights)
-    new_image = Image.new('RGB', (max_width, total_height))
+    new_image = Image.new('RGB', (max_width, total_height), 'white')
     y_offset = 0
     for image in images:
         new_image.paste(image, (0, y_offset))
         y_offset += image.size[1]
+    return new_image
+
+
+def df_to_image(df, title=None, encoding=None) -> bytes:
+    """
+    Render the table and the charts for a portfolio and stitch them together into one PNG, all in memory
+    """
+    images = [df_to_table(df, title=title), df_to_exposure_plot(df), df_to_return_plot(df)]
+    # There are no charts when there are no security positions
+    images = [image for image in images if image is not None]
+    return encode_image(stitch(images), encoding)
 
-    _fd, image_filename = tempfile.mkstemp(suffix='.png')
-    new_image.save(image_filename)
 
-    return image_filename
+leaderboard_formatters = {
+    book.VALUE: dollar_format,
+    book.USD: dollar_format,
+    book.MARK_PNL: dollar_format,
+    book.RETURN: format_maybe_nan('{:5,.2f}%'),
+}
+
+
+def leaderboard_to_image(summary, leaderboard, title=None, encoding=None) -> bytes:
+    """
+    Render the fund summary above a leaderboard of traders
+    """
+    negative_columns = (book.MARK_PNL, book.RETURN)
+    images = [
+        draw_table(summary, leaderboard_formatters, negative_columns=negative_columns, title=title),
+        draw_table(leaderboard.reset_index(drop=True), leaderboard_formatters, negative_columns=negative_columns),
+    ]
+    return encode_image(stitch(images), encoding)
@@ -0,0 +1,123 @@
+"""
+This module warms the bot up after a restart so that the first commands are as fast as the rest. The book, resting
+orders and settings are loaded concurrently before the bot connects. Then, while it connects, quotes for every held
+symbol are fetched in batches and every render worker renders once.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Awaitable, Iterable, List, Optional, Tuple
+
+import pandas
+
+from .book import CURRENT_PRICE, DIR, GUILD_ID, QTY, SHARES, SYMBOL, TIME, TRADE_PRICE, TRADER, TRADER_INIT_USD, \
+    compute_current_value, shares_and_dollars
+from .marketdata import MarketData
+from .orders import Order
+from .render import RenderPool
+from .std import Settings, Shard, Symbol, TradeError
+from .store import Store
+
+# The state the bot keeps in memory: the book, the resting orders and the settings
+State = Tuple[pandas.DataFrame, List[Order], Settings]
+
+# Held symbols are prefetched this many at a time so that one bad batch doesn't lose every quote
+QUOTE_BATCH_SIZE = 200
+
+
+async def load_state(store: Store, shard: Optional[Shard] = None) -> State:
+    """
+    Load the book and resting orders of [shard]'s guilds, and the settings, from [store] concurrently. An in-memory
+    [store] has a single connection that can't be shared between threads, so it is loaded sequentially.
+    """
+    if store.in_memory:
+        return store.load_book(shard), store.load_orders(shard), store.load_settings()
+    loop = asyncio.get_running_loop()
+    book, orders, settings = await asyncio.gather(
+        loop.run_in_executor(None, store.load_book, shard),
+        loop.run_in_executor(None, store.load_orders, shard),
+        loop.run_in_executor(None, store.load_settings))
+    return book, orders, settings
+
+
+def held_symbols(book: pandas.DataFrame) -> List[Symbol]:
+    """
+    The symbols that some trader in some guild of [book] has a non-zero position in. Only the symbols are kept, to
+    prefetch their quotes. [book] is left alone: this runs in a thread while commands keep using it.
+    """
+    # shares_and_dollars adds its columns to the frame it is given
+    positions = shares_and_dollars(book.copy())
+    positions = positions.groupby([GUILD_ID, TRADER, SYMBOL], as_index=False).agg({SHARES: 'sum'})
+    return sorted(positions.loc[positions[SHARES] != 0, SYMBOL].unique())
+
+
+async def prefetch_quotes(market_data: MarketData, symbols: List[Symbol], batch_size: int = QUOTE_BATCH_SIZE) -> int:
+    """
+    Fetch quotes for [symbols] into [market_data]'s cache, [batch_size] symbols per request. Returns how many quotes
+    were fetched.
+    """
+    async def fetch(batch: List[Symbol]) -> int:
+        try:
+            return len(await market_data.get_symbols_data(batch, use_cache=True))
+        except TradeError as e:
+            logging.warning(f'could not prefetch quotes for {len(batch)} symbols: {e}')
+            return 0
+
+    batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+    return sum(await asyncio.gather(*(fetch(batch) for batch in batches)))
+
+
+def sample_portfolio() -> pandas.DataFrame:
+    """
+    A small portfolio, as book.compute_current_value returns it, for the render workers to warm up on
+    """
+    trades = pandas.DataFrame([{
+        SYMBOL: 'AAPL',
+        DIR: 'BUY',
+        QTY: 10,
+        TRADE_PRICE: 100.,
+        TIME: datetime(2020, 1, 1),
+        TRADER: 'warmup',
+        GUILD_ID: 0,
+    }])
+    prices = pandas.DataFrame({SYMBOL: ['AAPL'], CURRENT_PRICE: [110.]})
+    return compute_current_value(shares_and_dollars(trades), prices, TRADER_INIT_USD)
+
+
+async def timed(name: str, phase: Awaitable) -> None:
+    """
+    Run the warmup [phase] and log how long it took. A phase that fails is logged and otherwise ignored: the bot
+    works without it, just slower at first.
+    """
+    start = time.perf_counter()
+    try:
+        result = await phase
+    except Exception:
+        logging.exception(f'warmup: {name} failed')
+        return
+    logging.info(f'warmup: {name} took {time.perf_counter() - start:.2f} s ({result})')
+
+
+async def warm_up(book: pandas.DataFrame, order_symbols: Iterable[Symbol], market_data: MarketData,
+                  render_pool: Optional[RenderPool], batch_size: int = QUOTE_BATCH_SIZE) -> None:
+    """
+    Prefetch quotes for the symbols held in [book] and for [order_symbols], while every worker of [render_pool]
+    renders a sample portfolio
+    """
+    async def quotes() -> str:
+        symbols = await asyncio.get_running_loop().run_in_executor(None, held_symbols, book)
+        symbols = sorted(set(symbols) | set(order_symbols))
+        return f'{await prefetch_quotes(market_data, symbols, batch_size)} of {len(symbols)} quotes'
+
+    async def renderers() -> str:
+        await render_pool.warm(sample_portfolio())
+        return f'{render_pool.max_workers} workers'
+
+    start = time.perf_counter()
+    phases = [timed('quotes', quotes())]
+    if render_pool is not None:
+        phases.append(timed('renderers', renderers()))
+    await asyncio.gather(*phases)
+    logging.info(f'warmup: done in {time.perf_counter() - start:.2f} s')
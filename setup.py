@@ -13,6 +13,7 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url='https://github.com/kelvinabrokwa/cant-hide-money-bot',
     packages=setuptools.find_packages(),
+    package_data={'cant_hide_money_bot': ['data/*.txt']},
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
@@ -24,7 +25,8 @@ setuptools.setup(
         'boto3',
         'click',
         'dataframe-image',
-        'discord.py',
+        # server.use_shard sets the shard count in discord.py's private connection state
+        'discord.py>=1.7,<1.8',
         'flake8',
         'flake8-annotations',
         'flake8-import-order',
@@ -0,0 +1,30 @@
+import pytest
+
+from cant_hide_money_bot import loadtest, server
+from cant_hide_money_bot.marketdata import MarketData
+from cant_hide_money_bot.std import Mode, SymbolData
+from cant_hide_money_bot.store import Store
+
+
+@pytest.fixture
+def store():
+    return Store(Mode.DEV, in_memory=True)
+
+
+@pytest.fixture
+def app(store):
+    """
+    The server's APP on an in-memory [store], quoting every symbol at $100 and without a render pool
+    """
+    quote = SymbolData(bid=100., ask=100., volume=None, currency='USD')
+    loadtest.install(store, MarketData(Mode.DEV, symbol_data_for_test=quote), render_pool=None)
+    return server.APP
+
+
+@pytest.fixture
+def ctx():
+    """
+    A command context for kelvin in guild 1
+    """
+    return loadtest.FakeContext(guild=loadtest.FakeGuild(id=1, name='guild'),
+                                author=loadtest.FakeAuthor(id=1, name='kelvin'), command=loadtest.FakeCommand('test'))
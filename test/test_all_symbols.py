@@ -0,0 +1,17 @@
+from cant_hide_money_bot.all_symbols import is_known_symbol, search, suggest
+
+
+def test_is_known_symbol():
+    assert is_known_symbol('AAPL')
+    assert is_known_symbol('aapl')
+    assert not is_known_symbol('AAPLL')
+
+
+def test_search():
+    assert search('AAP') == ['AAP', 'AAPL']
+    assert search('AA', limit=3) == ['AA', 'AACG', 'AACQ']
+    assert search('ZZZZZZ') == []
+
+
+def test_suggest():
+    assert 'AAPL' in suggest('AAPLL')
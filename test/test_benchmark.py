@@ -0,0 +1,23 @@
+from cant_hide_money_bot import book
+from cant_hide_money_bot.benchmark import fill_store, synthetic_book
+from cant_hide_money_bot.std import Mode
+from cant_hide_money_bot.store import Store
+
+
+def test_synthetic_book():
+    b = synthetic_book(1000, num_guilds=3, traders_per_guild=4, num_symbols=10)
+    assert b.equals(synthetic_book(1000, num_guilds=3, traders_per_guild=4, num_symbols=10))
+    assert not b.equals(synthetic_book(1000, num_guilds=3, traders_per_guild=4, num_symbols=10, seed=1))
+    assert b[book.GUILD_ID].nunique() == 3
+    assert b[book.TRADER].nunique() == 12
+    assert b[book.SYMBOL].nunique() == 10
+    assert b[book.TIME].is_monotonic_increasing
+
+    # The book looks the same after a round trip through the store
+    store = Store(Mode.DEV, in_memory=True)
+    fill_store(store, b)
+    loaded = store.load_book()
+    assert list(loaded.columns) == list(b.columns)
+    assert (loaded[book.TRADER] == b[book.TRADER]).all()
+    assert (loaded[book.TIME] == b[book.TIME]).all()
+    assert (loaded[book.TRADE_PRICE] == b[book.TRADE_PRICE]).all()
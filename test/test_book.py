@@ -3,7 +3,7 @@ from datetime import datetime
 import pandas
 import pytest
 
-from cant_hide_money_bot.book import TRADER_INIT_USD, all_portfolios
+from cant_hide_money_bot.book import TRADER_INIT_USD, all_portfolios, leaderboard, trades_page
 from cant_hide_money_bot.marketdata import MarketData
 from cant_hide_money_bot.std import Mode, SymbolData
 
@@ -26,7 +26,7 @@ async def test_price_is_the_same():
     def create_portfolio(symbol, shares, value, position):
         return {'symbol': symbol, 'shares': shares, 'value': value, 'position': position}
 
-    market_data = MarketData('', Mode.DEV)
+    market_data = MarketData(Mode.DEV)
 
     def symbol_data(current_price):
         return SymbolData(bid=current_price, ask=current_price, volume=1000000, currency='USD')
@@ -45,8 +45,8 @@ async def test_price_is_the_same():
         expected_portfolio = pandas.DataFrame([
             create_portfolio('Portfolio', None, expected_portfolio_value, None),
         ])
-        assert actual_portfolio.loc[actual_portfolio['symbol'] == 'Portfolio']['value'][0] == \
-               expected_portfolio.loc[expected_portfolio['symbol'] == 'Portfolio']['value'][0]
+        assert actual_portfolio.loc[actual_portfolio['symbol'] == 'Portfolio']['value'].iloc[0] == \
+               expected_portfolio.loc[expected_portfolio['symbol'] == 'Portfolio']['value'].iloc[0]
 
     await t(100, TRADER_INIT_USD)
     # If price goes down $1, you lose $100
@@ -69,8 +69,8 @@ async def test_price_is_the_same():
         expected_portfolio = pandas.DataFrame([
             create_portfolio('Portfolio', None, expected_portfolio_value, None),
         ])
-        assert actual_portfolio.loc[actual_portfolio['symbol'] == 'Portfolio']['value'][0] == \
-               expected_portfolio.loc[expected_portfolio['symbol'] == 'Portfolio']['value'][0]
+        assert actual_portfolio.loc[actual_portfolio['symbol'] == 'Portfolio']['value'].iloc[0] == \
+               expected_portfolio.loc[expected_portfolio['symbol'] == 'Portfolio']['value'].iloc[0]
 
     await t(101, TRADER_INIT_USD + 100)
     await t(100, TRADER_INIT_USD - 100)
@@ -93,8 +93,52 @@ async def test_price_is_the_same():
         expected_portfolio = pandas.DataFrame([
             create_portfolio('Portfolio', None, expected_portfolio_value, None),
         ])
-        assert actual_portfolio.loc[actual_portfolio['symbol'] == 'Portfolio']['value'][0] == \
-               expected_portfolio.loc[expected_portfolio['symbol'] == 'Portfolio']['value'][0]
+        assert actual_portfolio.loc[actual_portfolio['symbol'] == 'Portfolio']['value'].iloc[0] == \
+               expected_portfolio.loc[expected_portfolio['symbol'] == 'Portfolio']['value'].iloc[0]
 
     await t(100, TRADER_INIT_USD - 100)
     await t(101, TRADER_INIT_USD)
+
+
+def test_trades_page():
+    book = pandas.DataFrame({'symbol': [f'S{i}' for i in range(25)]})
+
+    page, num_pages = trades_page(book, 1, 10)
+    assert num_pages == 3
+    assert list(page['symbol']) == [f'S{i}' for i in range(24, 14, -1)]
+    page, _ = trades_page(book, 3, 10)
+    assert list(page['symbol']) == ['S4', 'S3', 'S2', 'S1', 'S0']
+
+    # The first page is always the latest trades, even when there is one more than fits
+    page, num_pages = trades_page(book.iloc[:21], 1, 20)
+    assert num_pages == 2
+    assert list(page['symbol']) == [f'S{i}' for i in range(20, 0, -1)]
+
+    with pytest.raises(ValueError):
+        trades_page(book, 4, 10)
+    assert trades_page(book.iloc[:0], 1, 10)[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_leaderboard():
+    def create_trade(trader, symbol, dir_, qty, price):
+        return {'symbol': symbol, 'dir': dir_, 'qty': qty, 'price': price,
+                'time': datetime.fromisoformat('2020-01-01T00:09:30'), 'trader': trader, 'guild_id': 100}
+
+    book = pandas.DataFrame([
+        create_trade('kelvin', 'ZVZZT', 'BUY', 100, 90),
+        create_trade('kelvin', 'ZXZZT', 'SELL', 10, 100),
+        create_trade('jane', 'ZVZZT', 'SELL', 100, 110),
+        create_trade('jane', 'ZVZZT', 'BUY', 100, 105),
+    ])
+    symbol_data = SymbolData(bid=100, ask=100, volume=1000000, currency='USD')
+    market_data = MarketData(Mode.DEV, symbol_data_for_test=symbol_data)
+    summary, traders = await leaderboard(book, market_data)
+
+    assert list(traders['trader']) == ['kelvin', 'jane']
+    assert list(traders['rank']) == [1, 2]
+    assert list(traders['value']) == [TRADER_INIT_USD + 1000, TRADER_INIT_USD + 500]
+    assert list(traders['positions']) == [2, 0]
+    assert summary.loc[0, 'traders'] == 2
+    assert summary.loc[0, 'positions'] == 2
+    assert summary.loc[0, 'value'] == 1500
@@ -0,0 +1,24 @@
+import pytest
+
+from cant_hide_money_bot import all_symbols, book, loadtest, server
+from cant_hide_money_bot.marketdata import MarketData, ReplayProvider
+from cant_hide_money_bot.render import RenderPool
+from cant_hide_money_bot.std import Mode
+from cant_hide_money_bot.store import Store
+
+
+@pytest.mark.asyncio
+async def test_loadtest():
+    provider = ReplayProvider.synthetic(all_symbols.all_symbols()[:20], steps=10)
+    render_pool = RenderPool(max_workers=1)
+    store = Store(Mode.DEV, in_memory=True)
+    try:
+        loadtest.install(store, MarketData(Mode.DEV, provider=provider), render_pool)
+        latencies = await loadtest.run(num_guilds=2, traders_per_guild=2, num_commands=30, concurrency=5)
+    finally:
+        render_pool.shutdown()
+
+    assert sum(len(samples) for samples in latencies.values()) == 30
+    assert set(server.APP.book[book.GUILD_ID]) <= {1, 2}
+    assert len(store.load_book().index) == len(server.APP.book.index) > 0
+    assert '30 commands' in loadtest.report(latencies, 1.)
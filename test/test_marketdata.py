@@ -1,7 +1,14 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
-from cant_hide_money_bot.marketdata import validate_symbol_data
-from cant_hide_money_bot.std import SymbolData
+from cant_hide_money_bot.marketdata import CircuitBreaker, CircuitOpenError, MarketData, QuoteProvider, \
+    ReplayProvider, YahooFetcher, validate_symbol_data
+from cant_hide_money_bot.std import Mode, Symbol, SymbolData, TradeError
 
 
 def test_validate_symbol_data():
@@ -15,4 +22,112 @@ def test_validate_symbol_data():
         validate_symbol_data(SymbolData(bid=10, ask=0, volume=None, currency=None))
 
     with pytest.raises(Exception):
-        validate_symbol_data(SymbolData(bid=0, ask=0, volume=None, currency=None))
\ No newline at end of file
+        validate_symbol_data(SymbolData(bid=0, ask=0, volume=None, currency=None))
+
+
+class FakeYahoo(ThreadingHTTPServer):
+    """A local stand-in for the Yahoo quote API that fails the first [failures] requests with a 503"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.requested_symbols = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                symbols = parse_qs(urlparse(handler.path).query)['symbols'][0].split(',')
+                if self.failures > 0:
+                    self.failures -= 1
+                    handler.send_response(503)
+                    handler.end_headers()
+                    return
+                self.requested_symbols.append(symbols)
+                body = json.dumps({'quoteResponse': {'result': [
+                    {'symbol': symbol, 'regularMarketPrice': 100, 'regularMarketVolume': 1000, 'currency': 'USD'}
+                    for symbol in symbols]}}).encode()
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'application/json')
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, *args):
+                pass
+
+        super().__init__(('127.0.0.1', 0), Handler)
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/v7/finance/quote'
+
+
+@pytest.mark.asyncio
+async def test_yahoo_fetcher_chunks():
+    symbols = [Symbol(f'S{i}') for i in range(25)]
+    with FakeYahoo() as server:
+        fetcher = YahooFetcher(url=server.url, chunk_size=10, rate=100)
+        symbols_data = await fetcher.fetch(symbols)
+    assert set(symbols_data) == set(symbols)
+    assert sorted(len(chunk) for chunk in server.requested_symbols) == [5, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_yahoo_fetcher_retries_and_breaks():
+    with FakeYahoo(failures=2) as server:
+        fetcher = YahooFetcher(url=server.url, rate=100, backoff_seconds=0.01)
+        assert set(await fetcher.fetch([Symbol('ZVZZT')])) == {'ZVZZT'}
+
+    with FakeYahoo(failures=100) as server:
+        fetcher = YahooFetcher(url=server.url, rate=100, max_retries=1, backoff_seconds=0.01,
+                               breaker=CircuitBreaker(failure_threshold=2))
+        with pytest.raises(TradeError):
+            await fetcher.fetch([Symbol('ZVZZT')])
+        failures_left = server.failures
+        with pytest.raises(CircuitOpenError):
+            await fetcher.fetch([Symbol('ZVZZT')])
+        # The open breaker failed fast without making a request
+        assert server.failures == failures_left
+
+
+def test_quote_provider_is_abstract():
+    class Incomplete(QuoteProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_circuit_breaker_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    time.sleep(0.06)
+    # One trial request goes through, everyone else still fails fast
+    breaker.acquire()
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    breaker.record_success()
+    breaker.acquire()
+    breaker.acquire()
+
+
+@pytest.mark.asyncio
+async def test_replay_provider(tmp_path):
+    path = tmp_path / 'replay.json'
+    ReplayProvider({'ZVZZT': [100, 101, 102]}).save(path)
+    market_data = MarketData(Mode.PROD, provider=ReplayProvider.from_file(path))
+    prices = [(await market_data.get_symbols_data([Symbol('ZVZZT')], use_cache=False))['ZVZZT'].mid()
+              for _ in range(4)]
+    assert prices == [100, 101, 102, 100]
+    # Fresh replayed quotes are cached like real ones
+    assert (await market_data.get_symbols_data([Symbol('ZVZZT')], use_cache=True))['ZVZZT'].mid() == 100
+
+    with pytest.raises(TradeError):
+        await ReplayProvider.synthetic(['ZVZZT'], error_rate=1).get_quotes([Symbol('ZVZZT')])
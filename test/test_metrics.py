@@ -0,0 +1,50 @@
+import math
+
+import aiohttp
+import pytest
+
+from cant_hide_money_bot import metrics
+from cant_hide_money_bot.metrics import Histogram, Metrics
+
+
+def test_histogram():
+    histogram = Histogram()
+    assert math.isnan(histogram.quantile(.5))
+
+    for seconds in [0.003] * 98 + [0.2, 3.]:
+        histogram.observe(seconds)
+    assert histogram.count == 100
+    assert histogram.max == 3.
+    assert histogram.quantile(.5) == 0.005
+    assert histogram.quantile(.99) == 0.25
+    assert histogram.quantile(1.) == 3.
+
+
+def test_metrics():
+    m = Metrics()
+    with m.stage(metrics.PERSIST):
+        pass
+    m.observe(metrics.COMMAND, 'BUY', 0.02)
+
+    assert m.histograms[(metrics.STAGE, metrics.PERSIST)].count == 1
+    assert 'BUY' in m.summary(metrics.COMMAND)
+    assert metrics.PERSIST not in m.summary(metrics.COMMAND)
+
+    text = m.prometheus()
+    assert 'cant_hide_money_bot_command_seconds_bucket{command="BUY",le="0.025"} 1' in text
+    assert 'cant_hide_money_bot_command_seconds_bucket{command="BUY",le="+Inf"} 1' in text
+    assert 'cant_hide_money_bot_stage_seconds_count{stage="persist"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_serve(unused_tcp_port):
+    m = Metrics()
+    m.observe(metrics.STAGE, metrics.RENDER, 0.1)
+    runner = await metrics.serve(m, unused_tcp_port)
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'http://127.0.0.1:{unused_tcp_port}/metrics') as response:
+                assert response.status == 200
+                assert await response.text() == m.prometheus()
+    finally:
+        await runner.cleanup()
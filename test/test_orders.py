@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from cant_hide_money_bot import server
+from cant_hide_money_bot.marketdata import ReplayProvider
+from cant_hide_money_bot.orders import Order, OrderBook, OrderType
+from cant_hide_money_bot.std import Dir, Dollars, Shares, StoreBusyError, Symbol, SymbolData
+
+
+def order(id_, type_, dir_, price, symbol='ZVZZT', qty=Shares(10)):
+    return Order(id=id_, type_=type_, symbol=Symbol(symbol), dir_=dir_, qty=qty, price=price, trader='kelvin',
+                 guild_id=1, time=datetime(2020, 1, 1))
+
+
+def quote(bid, ask):
+    return SymbolData(bid=bid, ask=ask, volume=None, currency='USD')
+
+
+def test_order_book():
+    book = OrderBook([
+        order(1, OrderType.LIMIT, Dir.BUY, 95.),
+        order(2, OrderType.LIMIT, Dir.BUY, 90.),
+        order(3, OrderType.LIMIT, Dir.SELL, 110.),
+        order(4, OrderType.STOP, Dir.SELL, 85.),
+        order(5, OrderType.STOP, Dir.BUY, 120.),
+        order(6, OrderType.LIMIT, Dir.BUY, 200., symbol='AAPL'),
+    ])
+    assert book.symbols() == ['AAPL', 'ZVZZT']
+
+    assert book.pop_triggered(Symbol('ZVZZT'), quote(99., 100.)) == []
+    # The ask falls to the first limit buy
+    assert [o.id for o in book.pop_triggered(Symbol('ZVZZT'), quote(94., 95.))] == [1]
+    # The bid gaps down through the stop sell and the ask through the other limit buy
+    assert [o.id for o in book.pop_triggered(Symbol('ZVZZT'), quote(80., 81.))] == [2, 4]
+    # The bid rises to the limit sell and the ask through the stop buy
+    assert [o.id for o in book.pop_triggered(Symbol('ZVZZT'), quote(120., 121.))] == [3, 5]
+    assert book.symbols() == ['AAPL']
+
+    assert book.remove(6).id == 6
+    assert book.remove(6) is None
+    assert len(book) == 0
+    assert book.pop_triggered(Symbol('AAPL'), quote(1., 1.)) == []
+
+
+def test_persist_orders(store):
+    stored = [store.persist_order(order(0, OrderType.LIMIT, Dir.BUY, 95.)),
+              store.persist_order(order(0, OrderType.STOP, Dir.SELL, 85., qty=Dollars(500)))]
+    assert [o.id for o in stored] == [1, 2]
+    assert store.load_orders() == stored
+    assert type(store.load_orders()[1].qty) == Dollars
+
+    store.delete_order(1)
+    assert store.load_orders() == stored[1:]
+
+
+@pytest.mark.asyncio
+async def test_limit_order_executes(app, store, ctx):
+    app.market_data.symbol_data_for_test = quote(99., 100.)
+
+    await server.limit.callback(ctx, 'buy', 'AAPL', '10', '95')
+    assert len(app.order_book) == 1
+    assert len(app.book.index) == 0
+
+    # The next fresh quote crosses the limit price
+    app.market_data.symbol_data_for_test = quote(94., 95.)
+    await app.market_data.get_symbols_data([Symbol('AAPL')], use_cache=False)
+    await asyncio.gather(*server._order_tasks)
+
+    assert len(app.order_book) == 0
+    assert store.load_orders() == []
+    assert app.book.iloc[0].to_dict()['price'] == 95.
+    assert len(store.load_book().index) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_quotes_trigger_orders(app, ctx):
+    app.market_data.provider = ReplayProvider({'AAPL': [100.]})
+    await server.limit.callback(ctx, 'buy', 'AAPL', '10', '95')
+
+    # Another process that shares the cache fetched a quote that crosses the limit price
+    app.market_data.cache.put_many({Symbol('AAPL'): quote(94., 95.)})
+    await server.check_orders()
+    await asyncio.gather(*server._order_tasks)
+
+    assert len(app.order_book) == 0
+    assert app.book.iloc[0].to_dict()['price'] == 95.
+
+
+@pytest.mark.asyncio
+async def test_unaffordable_order_is_cancelled(app, store, ctx, monkeypatch):
+    notifications = []
+
+    async def notify_guild(guild_id, message):
+        notifications.append(message)
+    monkeypatch.setattr(server, 'notify_guild', notify_guild)
+    await server.limit.callback(ctx, 'buy', 'AAPL', '20000', '95')
+
+    # The next fresh quote crosses the limit price but kelvin can't pay for 20000 shares
+    app.market_data.symbol_data_for_test = quote(94., 95.)
+    await app.market_data.get_symbols_data([Symbol('AAPL')], use_cache=False)
+    await asyncio.gather(*server._order_tasks)
+
+    assert len(app.order_book) == 0
+    assert store.load_orders() == []
+    assert len(app.book.index) == 0
+    assert len(notifications) == 1 and 'cancelled: ' in notifications[0]
+
+
+@pytest.mark.asyncio
+async def test_order_rests_again_when_the_store_is_busy(app, store, ctx, monkeypatch):
+    await server.limit.callback(ctx, 'buy', 'AAPL', '10', '95')
+
+    def busy(trades):
+        raise StoreBusyError('busy')
+    monkeypatch.setattr(store, 'persist_trades', busy)
+    app.market_data.symbol_data_for_test = quote(94., 95.)
+    await app.market_data.get_symbols_data([Symbol('AAPL')], use_cache=False)
+    await asyncio.gather(*server._order_tasks)
+
+    # The order rests again and nothing was booked
+    assert list(app.order_book.orders.values()) == store.load_orders()
+    assert len(app.order_book) == 1
+    assert len(app.book.index) == 0
+
+    monkeypatch.undo()
+    await app.market_data.get_symbols_data([Symbol('AAPL')], use_cache=False)
+    await asyncio.gather(*server._order_tasks)
+    assert len(app.order_book) == 0
+    assert len(app.book.index) == 1
@@ -0,0 +1,24 @@
+import time
+
+from cant_hide_money_bot.quote_cache import QuoteCache
+from cant_hide_money_bot.std import Symbol, SymbolData
+
+
+def test_quote_cache_is_shared(tmp_path):
+    path = tmp_path / 'quotes.db'
+    writer = QuoteCache(path)
+    reader = QuoteCache(path)
+    symbol = Symbol('ZVZZT')
+    symbol_data = SymbolData(bid=99, ask=100, volume=1000000, currency='USD')
+    writer.put(symbol, symbol_data)
+    assert reader.get(symbol) == symbol_data
+    assert reader.get(Symbol('AAPL')) is None
+
+
+def test_quote_cache_ttl(tmp_path):
+    cache = QuoteCache(tmp_path / 'quotes.db', max_age_seconds=60)
+    symbol_data = SymbolData(bid=99, ask=100, volume=1000000, currency='USD')
+    cache.put_many({Symbol('ZVZZT'): symbol_data, Symbol('AAPL'): symbol_data})
+    cache.put(Symbol('MSFT'), symbol_data, ttl=1)
+    time.sleep(1.5)
+    assert set(cache.get_many([Symbol('ZVZZT'), Symbol('AAPL'), Symbol('MSFT')])) == {'ZVZZT', 'AAPL'}
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from cant_hide_money_bot.benchmark import synthetic_portfolio
+from cant_hide_money_bot.render import RenderCache, RenderPool, frame_key
+from cant_hide_money_bot.std import RenderBusyError
+
+
+@pytest.mark.asyncio
+async def test_render_pool():
+    render_pool = RenderPool(max_workers=1, max_pending=1)
+    try:
+        portfolio = synthetic_portfolio(5)
+        first = asyncio.ensure_future(render_pool.render_portfolio(portfolio, title='kelvin'))
+        await asyncio.sleep(0)
+        with pytest.raises(RenderBusyError):
+            await render_pool.render_portfolio(portfolio, title='kelvin')
+        png = await first
+        assert png.startswith(b'\x89PNG')
+        assert render_pool.pending == 0
+        # The same render again is served from the cache, even though the pool only takes one render at a time
+        second = asyncio.ensure_future(render_pool.render_portfolio(portfolio.copy(), title='kelvin'))
+        assert await render_pool.render_portfolio(portfolio, title='kelvin') == png
+        assert await second == png
+    finally:
+        render_pool.shutdown()
+
+
+def test_render_cache():
+    cache = RenderCache(max_bytes=10)
+    cache.put('a', b'aaaa')
+    cache.put('b', b'bbbb')
+    # Using [a] makes [b] the least recently used
+    assert cache.get('a') == b'aaaa'
+    cache.put('c', b'cccc')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'aaaa' and cache.get('c') == b'cccc'
+    assert cache.bytes == 8
+    # Images that could never fit are not cached
+    cache.put('d', b'd' * 11)
+    assert cache.get('d') is None and len(cache) == 2
+
+
+def test_frame_key():
+    portfolio = synthetic_portfolio(5)
+    key = frame_key('render_portfolio', portfolio, 'kelvin')
+    assert key == frame_key('render_portfolio', portfolio.copy(), 'kelvin')
+    assert key != frame_key('render_portfolio', portfolio, 'jane')
+    assert key != frame_key('render_trades', portfolio, 'kelvin')
+    changed = portfolio.copy()
+    changed.iloc[0, 1] += 1
+    assert key != frame_key('render_portfolio', changed, 'kelvin')
@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+
+from cant_hide_money_bot import server
+from cant_hide_money_bot.marketdata import QuoteProvider
+from cant_hide_money_bot.schedules import Schedule, following_run, next_slot
+from cant_hide_money_bot.std import Dollars, Shares, Symbol, SymbolData, TradeError
+
+
+def schedule(trader='kelvin', symbol='AAPL', qty=Dollars(100), interval='weekly', next_run=datetime(2020, 1, 6, 10)):
+    return Schedule(id=0, symbol=Symbol(symbol), qty=qty, interval=interval, trader=trader, guild_id=1,
+                    next_run=next_run)
+
+
+def test_slots():
+    assert next_slot(datetime(2020, 1, 6, 9, 59, 59, 999)) == datetime(2020, 1, 6, 10)
+    assert next_slot(datetime(2020, 1, 6, 10)) == datetime(2020, 1, 6, 11)
+    assert next_slot(datetime(2020, 1, 6, 23, 30)) == datetime(2020, 1, 7)
+
+    assert following_run(schedule(), datetime(2020, 1, 6, 10)) == datetime(2020, 1, 13, 10)
+    # Missed runs are skipped
+    assert following_run(schedule(), datetime(2020, 1, 21, 9)) == datetime(2020, 1, 27, 10)
+    assert following_run(schedule(interval='daily'), datetime(2020, 1, 6, 10)) == datetime(2020, 1, 7, 10)
+
+
+def test_store_schedules(store):
+    assert store.next_schedule_run() is None
+
+    first = store.persist_schedule(schedule())
+    second = store.persist_schedule(schedule(qty=Shares(3), next_run=datetime(2020, 1, 7, 10)))
+    assert store.next_schedule_run() == datetime(2020, 1, 6, 10)
+    assert store.load_due_schedules(datetime(2020, 1, 6, 12)) == [first]
+    assert store.load_schedules('kelvin', 1) == [first, second]
+    assert store.load_schedules('kelvin', 2) == []
+
+    store.persist_schedule_runs([], [Schedule(**{**first.__dict__, 'next_run': datetime(2020, 1, 13, 10)})])
+    assert store.next_schedule_run() == datetime(2020, 1, 7, 10)
+
+    store.delete_schedule(second.id)
+    assert store.next_schedule_run() == datetime(2020, 1, 13, 10)
+
+
+@pytest.mark.asyncio
+async def test_run_schedules(app, store):
+    now = datetime(2020, 1, 6, 10)
+    affordable = [store.persist_schedule(schedule(symbol='AAPL', next_run=now)),
+                  store.persist_schedule(schedule(symbol='MSFT', qty=Shares(2), next_run=now))]
+    # 20,000 shares at $100 is more than the initial $1,000,000
+    unaffordable = store.persist_schedule(schedule(trader='whale', qty=Shares(20000), next_run=now))
+
+    await server.run_schedules(store.load_due_schedules(now), now)
+
+    trades = store.load_book()
+    assert list(trades['symbol']) == ['AAPL', 'MSFT']
+    assert list(trades['qty']) == [1, 2]
+    assert len(app.book.index) == 2
+    # Every schedule moves on, including the one that couldn't trade
+    assert store.load_due_schedules(now) == []
+    assert [s.next_run for s in store.load_schedules('kelvin', 1)] == [following_run(s, now) for s in affordable]
+    assert store.load_schedules('whale', 1)[0].next_run == following_run(unaffordable, now)
+
+
+@pytest.mark.asyncio
+async def test_run_schedules_until_cash_runs_out(app, store):
+    now = datetime(2020, 1, 6, 10)
+    # $600,000 then $600,000 more is more than the initial $1,000,000, so only the first schedule trades
+    store.persist_schedule(schedule(symbol='AAPL', qty=Shares(6000), next_run=now))
+    store.persist_schedule(schedule(symbol='MSFT', qty=Shares(6000), next_run=now))
+    # A cheaper schedule after the one that didn't fit doesn't jump the queue
+    store.persist_schedule(schedule(symbol='GOOG', qty=Shares(1), next_run=now))
+
+    await server.run_schedules(store.load_due_schedules(now), now)
+
+    assert list(store.load_book()['symbol']) == ['AAPL']
+    assert len(app.book.index) == 1
+    assert store.load_due_schedules(now) == []
+
+
+class DelistedProvider(QuoteProvider):
+    """
+    Fails every request that includes a delisted symbol, like the market data API does for a symbol without a price
+    """
+
+    async def get_quotes(self, symbols):
+        if 'DLST' in symbols:
+            raise TradeError('Could not get a price for DLST')
+        return {symbol: SymbolData(bid=100., ask=100., volume=None, currency='USD') for symbol in symbols}
+
+
+@pytest.mark.asyncio
+async def test_run_schedules_with_a_bad_quote(app, store):
+    app.market_data.provider = DelistedProvider()
+
+    now = datetime(2020, 1, 6, 10)
+    for symbol in ['AAPL', 'DLST', 'MSFT']:
+        store.persist_schedule(schedule(symbol=symbol, qty=Shares(1), next_run=now))
+    await server.run_schedules(store.load_due_schedules(now), now)
+
+    # Only the schedule without a quote misses its run
+    assert list(store.load_book()['symbol']) == ['AAPL', 'MSFT']
+    assert store.load_due_schedules(now) == []
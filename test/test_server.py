@@ -1,5 +1,14 @@
-from cant_hide_money_bot.server import parse_qty
-from cant_hide_money_bot.std import Dollars, Shares
+import pytest
+from click.testing import CliRunner
+from discord.ext import commands
+from pyrsistent import freeze
+
+from cant_hide_money_bot import loadtest, server
+from cant_hide_money_bot.marketdata import MarketData, ReplayProvider
+from cant_hide_money_bot.server import find_money_word, handle_basket, money_message_channels, parse_basket, \
+    parse_qty
+from cant_hide_money_bot.std import Dir, Dollars, Mode, Shard, Shares, SymbolData
+from cant_hide_money_bot.store import Store
 
 
 def test_parse_qty():
@@ -10,3 +19,87 @@ def test_parse_qty():
     shares_200 = parse_qty('200')
     assert type(shares_200) == Shares
     assert float(shares_200) == 200.
+
+
+def test_find_money_word():
+    assert find_money_word('show me the MONEY') == 'money'
+    assert find_money_word('gotta get that guap and that bread') == 'guap'
+    assert find_money_word('newspaper') == 'paper'
+    assert find_money_word('nothing to see here') is None
+
+
+def test_money_message_channels():
+    settings = freeze({
+        1: {'channel': 'trading'},
+        2: {'channel': 'trading', 'money_message': 'False'},
+        3: {'money_message': 'True'},
+        4: {'channel': 'stonks', 'money_message': 'True'},
+    })
+    assert money_message_channels(settings) == {1: 'trading', 4: 'stonks'}
+
+
+def test_parse_basket():
+    legs = parse_basket(['BUY', 'aapl', '10', 'MSFT', '$500', 'sell', 'TSLA', '5'])
+    assert legs == [(Dir.BUY, 'AAPL', 10.), (Dir.BUY, 'MSFT', 500.), (Dir.SELL, 'TSLA', 5.)]
+    assert isinstance(legs[1][2], Dollars)
+
+    for args in [[], ['BUY'], ['AAPL', '10'], ['BUY', 'AAPL'], ['BUY', 'AAPL', 'ten']]:
+        with pytest.raises(ValueError):
+            parse_basket(args)
+
+
+@pytest.mark.asyncio
+async def test_handle_basket():
+    store = Store(Mode.DEV, in_memory=True)
+    quote = SymbolData(bid=100., ask=100., volume=None, currency='USD')
+    market_data = MarketData(Mode.DEV, symbol_data_for_test=quote)
+    loadtest.install(store, market_data, render_pool=None)
+    guild = loadtest.FakeGuild(id=1, name='guild')
+
+    # Together the legs cost more than the trader has so nothing is traded
+    response = await handle_basket([(Dir.BUY, 'AAPL', Shares(6000)), (Dir.BUY, 'MSFT', Shares(6000))], 'kelvin', guild)
+    assert response.startswith('Nothing was traded')
+    assert len(server.APP.book.index) == 0
+
+    response = await handle_basket([(Dir.BUY, 'AAPL', Shares(10)), (Dir.SELL, 'MSFT', Dollars(500))], 'kelvin', guild)
+    assert response.split('\n')[-1] == 'Net cash: $-500.00'
+    assert len(server.APP.book.index) == len(store.load_book().index) == 2
+
+    # Cash is per guild
+    for guild_id in [1, 2]:
+        guild = loadtest.FakeGuild(id=guild_id, name='guild')
+        response = await handle_basket([(Dir.BUY, 'AAPL', Shares(9000))], 'kelvin', guild)
+        assert response.startswith('BOUGHT 9000 AAPL')
+
+
+@pytest.mark.asyncio
+async def test_symbols_outside_the_universe():
+    store = Store(Mode.DEV, in_memory=True)
+    loadtest.install(store, MarketData(Mode.PROD, provider=ReplayProvider({'SPY': [400.], 'AAPL': [100.]})),
+                     render_pool=None)
+    ctx = loadtest.FakeContext(guild=loadtest.FakeGuild(id=1, name='guild'),
+                               author=loadtest.FakeAuthor(id=1, name='kelvin'), command=loadtest.FakeCommand('BUY'))
+
+    # ETFs aren't in the universe but the quote provider knows them
+    assert await server.check_symbol_and_send_error_message('SPY', ctx)
+    assert await server.check_symbol_and_send_error_message('AAPL', ctx)
+    assert ctx.sent == []
+
+    assert not await server.check_symbol_and_send_error_message('AAPLL', ctx)
+    assert ctx.sent[0].startswith('AAPLL is not a symbol I know about. Did you mean one of: AAPL')
+
+
+@pytest.mark.asyncio
+async def test_use_shard():
+    bot = commands.Bot('!')
+    server.use_shard(bot, Shard(id=1, count=4))
+    # The gateway takes the shard id from the client and the shard count from the connection state
+    assert (bot.shard_id, bot._connection.shard_count) == (1, 4)
+
+
+def test_no_replay_quotes_in_prod(tmp_path):
+    quotes = tmp_path / 'quotes.json'
+    ReplayProvider({'AAPL': [100.]}).save(quotes)
+    result = CliRunner().invoke(server.main, ['--mode', 'prod', '--replay-quotes', str(quotes)])
+    assert result.exit_code == 2
+    assert '--replay-quotes only works with --mode dev' in result.output
@@ -1,6 +1,9 @@
+import asyncio
 import time
 
-from cant_hide_money_bot.std import TimedCache
+import pytest
+
+from cant_hide_money_bot.std import Debouncer, TimedCache
 
 
 def test_timed_cache():
@@ -11,3 +14,26 @@ def test_timed_cache():
     assert cache.get(key) == value
     time.sleep(2)
     assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_debouncer():
+    debouncer = Debouncer(0.05)
+    calls = []
+
+    def record(key, i):
+        async def f():
+            calls.append((key, i))
+        return f
+
+    for i in range(5):
+        debouncer.call('kelvin', record('kelvin', i))
+        await asyncio.sleep(0.01)
+    debouncer.call('raph', record('raph', 0))
+    assert len(debouncer) == 2
+    assert calls == []
+
+    await debouncer.drain()
+    # Only the last call of the burst runs, and other keys are independent
+    assert sorted(calls) == [('kelvin', 4), ('raph', 0)]
+    assert len(debouncer) == 0
@@ -1,7 +1,10 @@
 import sqlite3
 from datetime import datetime
 
-from cant_hide_money_bot.std import Dir, Mode, Shares, Symbol, Trade
+import pytest
+
+from cant_hide_money_bot import store as store_module
+from cant_hide_money_bot.std import Dir, Mode, Shard, Shares, StoreBusyError, Symbol, Trade
 from cant_hide_money_bot.store import Store
 from cant_hide_money_bot.utils import dict_of_trade
 
@@ -29,3 +32,40 @@ def test_setting():
     store.set_setting(guild, key, new_value)
     settings = store.load_settings()
     assert settings[guild][key] == new_value
+
+
+def test_shard():
+    store = Store(Mode.DEV, in_memory=True)
+    # Discord puts a guild on shard (guild_id >> 22) % shard_count
+    guild_ids = [0, 1 << 22, 2 << 22, 3 << 22 | 12345]
+    for guild_id in guild_ids:
+        store.persist_trade(Trade(symbol=Symbol('ZVZZT'), dir_=Dir.BUY, qty=Shares(1), price=100,
+                                  time=datetime(2020, 1, 1), trader='kelvin', guild_id=guild_id))
+
+    assert len(store.load_book().index) == 4
+    for shard_id in range(2):
+        shard = Shard(shard_id, 2)
+        book = store.load_book(shard=shard)
+        assert list(book['guild_id']) == [guild_id for guild_id in guild_ids if shard.owns(guild_id)]
+        assert len(book.index) == 2
+
+
+def test_busy(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module, 'DEFAULT_DIR', tmp_path)
+    monkeypatch.setattr(store_module, 'BUSY_TIMEOUT_SECONDS', 0.1)
+    store = Store(Mode.DEV)
+    trade = Trade(symbol=Symbol('ZVZZT'), dir_=Dir.BUY, qty=Shares(1), price=100, time=datetime(2020, 1, 1),
+                  trader='kelvin', guild_id=1)
+
+    # Another process holds the write lock
+    other = sqlite3.connect(store_module.db_path(Mode.DEV))
+    other.execute('BEGIN IMMEDIATE')
+    with pytest.raises(StoreBusyError):
+        store.persist_trade(trade)
+    # Readers aren't held up
+    assert len(store.load_book().index) == 0
+
+    other.rollback()
+    other.close()
+    store.persist_trade(trade)
+    assert len(store.load_book().index) == 1
@@ -0,0 +1,129 @@
+import io
+import os
+import re
+import tempfile
+from html.parser import HTMLParser
+
+import numpy
+import pandas
+import pytest
+from PIL import Image
+
+from cant_hide_money_bot import book, utils
+from cant_hide_money_bot.benchmark import styler_html, synthetic_portfolio
+from cant_hide_money_bot.utils import HEADER_BACKGROUND, MARGIN, NEGATIVE_BACKGROUND, ROW_HEIGHT, draw_table, \
+    portfolio_formatters
+
+
+def test_draw_table():
+    df = pandas.DataFrame([
+        {book.SYMBOL: 'ZVZZT', book.VALUE: 100., book.MARK_PNL: -10.},
+        {book.SYMBOL: book.USD_SYMBOL, book.VALUE: 1000., book.MARK_PNL: numpy.nan},
+    ])
+    image = draw_table(df, portfolio_formatters, negative_columns=(book.MARK_PNL,), title='kelvin', min_width=750)
+    assert image.width == 750
+    assert image.height == 4 * ROW_HEIGHT + 2 * MARGIN
+
+    def color_at(x, row):
+        return '#{:02X}{:02X}{:02X}'.format(*image.getpixel((x, MARGIN + row * ROW_HEIGHT + 2)))
+
+    assert color_at(MARGIN + 1, 1) == HEADER_BACKGROUND.upper()
+    # The negative mark pnl is highlighted, the NaN below it is not
+    last_column_x = next(x for x in range(image.width - 1, 0, -1) if color_at(x, 2) != '#FFFFFF') - 1
+    assert color_at(last_column_x, 2) == NEGATIVE_BACKGROUND.upper()
+    assert color_at(last_column_x, 3) != NEGATIVE_BACKGROUND.upper()
+
+
+def test_df_to_image_soak(tmp_path, monkeypatch):
+    """Rendering must not leak file descriptors or leave files behind"""
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    portfolio = synthetic_portfolio(10)
+    # Warm up so that fonts and matplotlib caches are already open
+    utils.df_to_image(portfolio, title='kelvin')
+    fds_before = len(os.listdir('/proc/self/fd'))
+    for _ in range(50):
+        png = utils.df_to_image(portfolio, title='kelvin')
+    assert png.startswith(b'\x89PNG')
+    assert len(os.listdir('/proc/self/fd')) == fds_before
+    assert os.listdir(tmp_path) == []
+
+
+class TableParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.cells = []
+        self.ids = []
+        self.inline_styles = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('th', 'td'):
+            attrs = dict(attrs)
+            self.cells.append('')
+            self.ids.append(attrs.get('id'))
+            self.inline_styles.append(attrs.get('style'))
+
+    def handle_data(self, data):
+        if self.cells:
+            self.cells[-1] += data
+
+
+def test_df_to_html():
+    # The direct HTML shows the same cells and highlights the same ones as the Styler HTML did
+    portfolio = synthetic_portfolio(30)
+    direct = TableParser()
+    direct_source = utils.df_to_html(portfolio, portfolio_formatters, negative_columns=(book.MARK_PNL, book.RETURN),
+                                     title='kelvin')
+    direct.feed(direct_source)
+    styler = TableParser()
+    styler_source = styler_html(portfolio, title='kelvin')
+    styler.feed(styler_source)
+
+    assert [' '.join(cell.split()) for cell in direct.cells] == [' '.join(cell.split()) for cell in styler.cells]
+    assert '<caption>kelvin</caption>' in direct_source
+
+    highlighted_ids = {
+        cell_id for selector in re.findall(r'([^{}]+)\{\s*background-color:\s*' + NEGATIVE_BACKGROUND, styler_source)
+        for cell_id in re.findall(r'#(\S+?)[,\s]', selector + ' ')}
+    styler_highlighted = [cell_id in highlighted_ids for cell_id in styler.ids]
+    direct_highlighted = [style is not None and NEGATIVE_BACKGROUND in style for style in direct.inline_styles]
+    assert any(direct_highlighted)
+    assert direct_highlighted == styler_highlighted
+
+
+def test_df_to_text():
+    df = pandas.DataFrame([
+        {book.SYMBOL: 'ZVZZT', book.VALUE: 100., book.MARK_PNL: -10.},
+        {book.SYMBOL: book.USD_SYMBOL, book.VALUE: 1000., book.MARK_PNL: numpy.nan},
+    ])
+    lines = utils.df_to_text(df, title='kelvin').split('\n')
+    assert lines[0] == 'kelvin'
+    assert lines[1].split() == [book.SYMBOL, book.VALUE, 'mark', 'pnl']
+    assert lines[3].split() == ['ZVZZT', '$', '100.00', '$', '-10.00']
+    assert lines[4].split() == [book.USD_SYMBOL, '$', '1,000.00']
+
+
+def test_encode_image():
+    image = Image.open(io.BytesIO(utils.df_to_image(synthetic_portfolio(10), encoding=utils.Encoding(utils.PNG))))
+    for image_format in [utils.PNG, utils.PALETTE_PNG, utils.WEBP]:
+        data = utils.encode_image(image, utils.Encoding(image_format))
+        decoded = Image.open(io.BytesIO(data))
+        assert decoded.format == ('WEBP' if image_format == utils.WEBP else 'PNG')
+        assert utils.Encoding(image_format).extension == decoded.format.lower()
+        assert decoded.size == image.size
+
+    with pytest.raises(ValueError):
+        utils.Encoding('jpg')
+
+    data = utils.encode_image(image, utils.Encoding(utils.PNG, max_bytes=20000))
+    assert len(data) <= 20000
+    assert Image.open(io.BytesIO(data)).width < image.width
+
+
+def test_encoding_from_env(monkeypatch):
+    monkeypatch.setenv('IMAGE_FORMAT', 'webp')
+    monkeypatch.setenv('IMAGE_MAX_BYTES', '1000')
+    assert utils.encoding_from_env() == utils.Encoding(utils.WEBP, max_bytes=1000)
+
+    monkeypatch.setenv('IMAGE_FORMAT', 'jpeg')
+    with pytest.raises(ValueError, match='IMAGE_FORMAT'):
+        utils.encoding_from_env()
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from cant_hide_money_bot import server, warmup
+from cant_hide_money_bot.marketdata import MarketData
+from cant_hide_money_bot.render import RenderPool
+from cant_hide_money_bot.std import Dir, Mode, Symbol, Trade
+
+
+def trade(symbol, dir_, qty, trader='kelvin', guild_id=1):
+    return Trade(symbol=Symbol(symbol), dir_=dir_, qty=qty, price=100., trader=trader, guild_id=guild_id,
+                 time=datetime(2020, 1, 1))
+
+
+@pytest.mark.asyncio
+async def test_load_state(store):
+    store.persist_trades([trade('AAPL', Dir.BUY, 10), trade('MSFT', Dir.BUY, 5, guild_id=2)])
+    store.set_setting(1, 'foo', 'bar')
+
+    book, orders, settings = await warmup.load_state(store)
+    assert book.equals(store.load_book())
+    assert orders == []
+    assert settings == store.load_settings()
+
+
+def test_held_symbols(store):
+    store.persist_trades([trade('AAPL', Dir.BUY, 10), trade('AAPL', Dir.SELL, 10),
+                          trade('MSFT', Dir.BUY, 5), trade('AAPL', Dir.SELL, 3, trader='raph', guild_id=2)])
+    book = store.load_book()
+    # kelvin is flat AAPL but raph is short it
+    assert warmup.held_symbols(book) == ['AAPL', 'MSFT']
+    # The book is not touched
+    assert book.equals(store.load_book())
+
+
+@pytest.mark.asyncio
+async def test_warm_up(store):
+    market_data = MarketData(Mode.DEV)
+    fetched = []
+    market_data.add_listener(lambda symbols_data: fetched.append(sorted(symbols_data)))
+    store.persist_trades([trade('AAPL', Dir.BUY, 10), trade('MSFT', Dir.BUY, 5), trade('GOOG', Dir.SELL, 1)])
+
+    render_pool = RenderPool(max_workers=1)
+    try:
+        await warmup.warm_up(store.load_book(), [Symbol('TSLA')], market_data, render_pool, batch_size=2)
+    finally:
+        render_pool.shutdown()
+    # Held and order symbols are fetched in batches
+    assert sorted(fetched) == [['AAPL', 'GOOG'], ['MSFT', 'TSLA']]
+
+
+@pytest.mark.asyncio
+async def test_readiness_gate(app, store, ctx):
+    # Portfolios as text so that there is nothing to render
+    store.set_setting(1, server.OUTPUT_SETTING, server.TEXT_OUTPUT)
+    app.update_settings(store.load_settings())
+
+    # Commands wait for the warmup...
+    app.warmup = asyncio.get_running_loop().create_task(asyncio.sleep(0.1))
+    await server.buy.callback(ctx, 'AAPL', '1')
+    assert app.warmup.done()
+    assert app.first_fast_response is not None
+
+    # ...but not past the readiness timeout, and giving up doesn't cancel it
+    app.warmup = asyncio.get_running_loop().create_task(asyncio.sleep(10))
+    app.ready_timeout_seconds = 0.
+    await server.buy.callback(ctx, 'AAPL', '1')
+    assert not app.warmup.done()
+    app.warmup.cancel()
+    assert len(app.book.index) == 2
+
+    await app.portfolio_debouncer.drain()
+    assert len(ctx.sent) == 3